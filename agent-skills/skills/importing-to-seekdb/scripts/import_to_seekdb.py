@@ -3,7 +3,7 @@
 Import CSV/Excel files to seekdb vector database and manage collections.
 
 Usage:
-    python import_to_seekdb.py import <file_path> [--vectorize-column <column_name>] [--collection <name>]
+    python import_to_seekdb.py import <file_path> [--vectorize-column <column_name>] [--collection <name>] [--id-column <column_name>]
     python import_to_seekdb.py delete <collection_name>
 
 Examples:
@@ -16,6 +16,9 @@ Examples:
     # Import Excel file with custom collection name
     python import_to_seekdb.py import products.xlsx --vectorize-column Description --collection my_products
     
+    # Re-runnable import: ids derived from a key column, existing rows updated
+    python import_to_seekdb.py import products.csv --vectorize-column Details --id-column SKU
+    
     # Delete a collection
     python import_to_seekdb.py delete my_collection
 
@@ -25,11 +28,16 @@ This script is designed for use in Claude Code (non-interactive environment).
 """
 
 import argparse
+import functools
+import itertools
 import os
-import uuid
 import sys
+import threading
+import uuid
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 try:
     from dotenv import load_dotenv
@@ -38,11 +46,18 @@ except ImportError:
     pass  # dotenv is optional, will use environment variables directly
 
 try:
+    import numpy as np
     import pandas as pd
 except ImportError:
     print("Error: pandas is required. Install with: pip install pandas openpyxl")
     sys.exit(1)
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None  # optional, speeds up building metadata dicts
+
 try:
     import pyseekdb
 except ImportError:
@@ -65,8 +80,75 @@ else:
     os.makedirs(seekdb_path, exist_ok=True)
     client = pyseekdb.Client(path=seekdb_path)
 
-def read_file(file_path: str) -> pd.DataFrame:
-    """Read CSV or Excel file into DataFrame."""
+# Rows read from the source file at a time; inserts are further split by batch_size
+READ_CHUNK_ROWS = 10_000
+
+# Namespace for ids derived from --id-column values (uuid5), fixed so that
+# re-importing the same rows yields the same ids
+KEY_ID_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_DNS, "import.seekdb")
+
+# Parsed Excel sheets are cached next to the source as <name>.seekdb.parquet
+# (e.g. data.xlsx.seekdb.parquet), keyed by the source's size and mtime
+PARQUET_CACHE_SUFFIX = ".seekdb.parquet"
+PARQUET_CACHE_SOURCE_KEY = b"seekdb.source"
+
+
+@functools.lru_cache(maxsize=None)
+def _best_excel_engine() -> Optional[str]:
+    """Return "calamine" if python-calamine is usable, else None (pandas default engine)."""
+    # Same choice as read_excel.py; not imported from there, since that
+    # module warns or exits at import time and CSV imports don't need it
+    try:
+        import python_calamine  # noqa: F401
+    except ImportError:
+        return None
+    # pandas gained the calamine engine in 2.2
+    major, minor = (int(x) for x in pd.__version__.split(".")[:2])
+    return "calamine" if (major, minor) >= (2, 2) else None
+
+
+def read_cached_excel(path: Path, cache: bool = True) -> pd.DataFrame:
+    """
+    Read the first sheet of an Excel file, reusing a Parquet cache when possible.
+    
+    With pyarrow installed, the parsed sheet is written to a sibling
+    <name>.seekdb.parquet file that records the source's size and mtime, and
+    it is read on later runs while both still match. Sheets Parquet can't
+    store are just not cached.
+    """
+    use_cache = cache and pa is not None
+    cache_path = path.with_name(path.name + PARQUET_CACHE_SUFFIX)
+    # Compared for equality, so a file copied in with an older mtime
+    # (cp -p) invalidates the cache too
+    stat = path.stat()
+    source = f"{stat.st_size}:{stat.st_mtime_ns}".encode()
+    if use_cache and cache_path.exists():
+        try:
+            cached_source = (pq.read_schema(cache_path).metadata or {}).get(PARQUET_CACHE_SOURCE_KEY)
+        except (OSError, pa.ArrowException):
+            cached_source = None  # unreadable cache, rebuild it
+        if cached_source == source:
+            return pd.read_parquet(cache_path, engine="pyarrow")
+    
+    df = pd.read_excel(path, engine=_best_excel_engine())
+    
+    if use_cache:
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            table = table.replace_schema_metadata(
+                {**(table.schema.metadata or {}), PARQUET_CACHE_SOURCE_KEY: source})
+            pq.write_table(table, tmp_path, compression="zstd")
+            os.replace(tmp_path, cache_path)
+        except (OSError, ValueError, pa.ArrowException) as e:
+            # e.g. mixed-type or non-string column names, read-only directory
+            print(f"Warning: not caching {path.name} as Parquet: {e}")
+            tmp_path.unlink(missing_ok=True)
+    return df
+
+
+def read_file(file_path: str, *, cache: bool = True) -> pd.DataFrame:
+    """Read CSV or Excel file into DataFrame (Excel via the Parquet cache)."""
     path = Path(file_path)
     
     if not path.exists():
@@ -77,31 +159,106 @@ def read_file(file_path: str) -> pd.DataFrame:
     if suffix == '.csv':
         return pd.read_csv(file_path)
     elif suffix in ['.xlsx', '.xls']:
-        return pd.read_excel(file_path)
+        return read_cached_excel(path, cache)
+    else:
+        raise ValueError(f"Unsupported file format: {suffix}. Use .csv or .xlsx")
+
+
+def iter_file_chunks(
+    file_path: str,
+    chunksize: int = READ_CHUNK_ROWS,
+    *,
+    cache: bool = True
+) -> Iterator[pd.DataFrame]:
+    """
+    Yield a CSV or Excel file as DataFrames of at most chunksize rows.
+    
+    CSV files are streamed with pandas' chunked reader, so only one chunk is
+    in memory at a time. Excel files cannot be streamed into pandas and are
+    read whole (through the Parquet cache, see read_cached_excel), then
+    sliced. At least one (possibly empty) chunk is yielded.
+    """
+    path = Path(file_path)
+    
+    if not path.exists():
+        raise FileNotFoundError(f"File not found: {file_path}")
+    
+    suffix = path.suffix.lower()
+    
+    if suffix == '.csv':
+        with pd.read_csv(file_path, chunksize=chunksize) as reader:
+            yield from reader
+    elif suffix in ['.xlsx', '.xls']:
+        df = read_cached_excel(path, cache)
+        for start in range(0, max(len(df), 1), chunksize):
+            yield df.iloc[start:start + chunksize]
     else:
         raise ValueError(f"Unsupported file format: {suffix}. Use .csv or .xlsx")
 
 
 def clean_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     """Clean DataFrame for import."""
-    # Convert numpy types to Python types
-    for col in df.columns:
-        if df[col].dtype == 'int64':
-            df[col] = df[col].astype(object).where(df[col].notna(), None)
-        elif df[col].dtype == 'float64':
-            df[col] = df[col].astype(object).where(df[col].notna(), None)
-    
-    # Fill NaN with empty string for string columns
-    df.infer_objects(copy=False).fillna('')
+    # Pick string columns first: the numeric step below creates object
+    # columns whose None placeholders must not be filled
+    str_cols = df.select_dtypes(include=["object", "string"]).columns
+    
+    # Replace NaN with None in numeric columns. Only columns that actually
+    # contain NaN are converted; to_dict() already yields Python scalars.
+    nan_mask = df.select_dtypes(include=["int64", "float64"]).isna()
+    for col in nan_mask.columns[nan_mask.any().to_numpy()]:
+        values = np.asarray(df[col].to_numpy(), dtype=object)
+        values[nan_mask[col].to_numpy()] = None
+        df[col] = values
+    
+    # Fill NaN with empty string for string columns, skipping the pass when
+    # none of them has a missing value
+    missing = str_cols[df[str_cols].isna().any().to_numpy()]
+    if len(missing):
+        df[missing] = df[missing].fillna('')
     
     return df
 
 
+def dataframe_records(df: pd.DataFrame) -> list[dict]:
+    """Convert rows to metadata dicts, via pyarrow's C++ converter when available."""
+    if pa is not None:
+        try:
+            return pa.Table.from_pandas(df, preserve_index=False).to_pylist()
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass  # e.g. object columns mixing numbers and strings
+    # Box each column once with Series.tolist() (Python scalars, Timestamps
+    # kept), then build rows with zip; much cheaper than to_dict("records")
+    keys = df.columns.tolist()
+    columns = [series.tolist() for _, series in df.items()]
+    return [dict(zip(keys, row)) for row in zip(*columns)]
+
+
+def generate_ids(n: int) -> list[str]:
+    """Generate n random (version 4) UUID strings from a single os.urandom call."""
+    raw = np.frombuffer(os.urandom(16 * n), dtype=np.uint8).reshape(n, 16).copy()
+    # Set the RFC 4122 version (4) and variant bits for every id at once
+    raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80
+    h = raw.tobytes().hex()
+    return [
+        f"{h[k:k+8]}-{h[k+8:k+12]}-{h[k+12:k+16]}-{h[k+16:k+20]}-{h[k+20:k+32]}"
+        for k in range(0, 32 * n, 32)
+    ]
+
+
+def key_ids(keys: pd.Series) -> list[str]:
+    """Derive deterministic (version 5) UUID strings from natural key values."""
+    return [str(uuid.uuid5(KEY_ID_NAMESPACE, key)) for key in keys.astype(str).tolist()]
+
+
 def import_to_seekdb(
     file_path: str,
     vectorize_column: Optional[str] = None,
     collection_name: Optional[str] = None,
-    batch_size: int = 100
+    batch_size: int = 100,
+    max_pending: int = 4,
+    cache: bool = True,
+    id_column: Optional[str] = None
 ):
     """
     Import CSV/Excel file to seekdb.
@@ -111,6 +268,12 @@ def import_to_seekdb(
         vectorize_column: Column name to vectorize for semantic search (optional)
         collection_name: Name of the collection (default: derived from filename)
         batch_size: Number of records per batch insert
+        max_pending: Max prepared batches queued for the insert thread in
+            server mode; embedded mode inserts inline
+        cache: Reuse/write a <name>.seekdb.parquet cache for Excel files
+        id_column: Column with unique, non-empty row keys. Ids are derived
+            from it (uuid5) and rows are upserted, so re-running an import
+            updates records instead of duplicating them. Default: random ids
     
     Environment Variables (from .env):
         SEEKDB_HOST: seekdb server host (for server mode)
@@ -119,15 +282,23 @@ def import_to_seekdb(
         SEEKDB_USER: Username (default: root)
         SEEKDB_PASSWORD: Password
     """
-    # Step 1: Read file
+    # Step 1: Open file (CSV is streamed chunk by chunk)
     print(f"Reading file: {file_path}")
-    df = read_file(file_path)
-    df = clean_dataframe(df)
-    print(f"Loaded {len(df)} records with columns: {df.columns.tolist()}")
+    chunks = iter_file_chunks(file_path, cache=cache)
+    first_chunk = next(chunks)
+    columns = first_chunk.columns.tolist()
+    print(f"Columns: {columns}")
     
     # Validate vectorize column
-    if vectorize_column and vectorize_column not in df.columns:
-        raise ValueError(f"Column '{vectorize_column}' not found. Available columns: {df.columns.tolist()}")
+    if vectorize_column and vectorize_column not in columns:
+        raise ValueError(f"Column '{vectorize_column}' not found. Available columns: {columns}")
+    
+    # Validate id column
+    if id_column and id_column not in columns:
+        raise ValueError(f"Column '{id_column}' not found. Available columns: {columns}")
+    
+    # Every chunk shares the first chunk's header, so resolve metadata columns once
+    metadata_columns = first_chunk.columns.drop(vectorize_column) if vectorize_column else None
     
     # Step 2: Connect to seekdb (read connection params from environment)
     print("Connecting to seekdb...")
@@ -153,47 +324,112 @@ def import_to_seekdb(
             embedding_function=None
         )
     
-    # Step 5: Prepare data
-    ids = [str(uuid.uuid4()) for _ in range(len(df))]
-    
-    documents: Optional[list[str]] = None
-    metadatas: list[dict]
-    
-    if vectorize_column:
-        documents = df[vectorize_column].astype(str).tolist()
-        metadata_columns:list[str] = [col for col in df.columns if col != vectorize_column]
-        metadatas = df[metadata_columns].to_dict("records")  # type: ignore[call-overload]
-    else:
-        metadatas = df.to_dict("records")  # type: ignore[call-overload]
-    
-    # Step 6: Import in batches
-    print(f"Importing {len(ids)} records in batches of {batch_size}...")
+    # Steps 5-6: Prepare and import each chunk in batches
+    print(f"Importing records in batches of {batch_size}...")
     total_imported = 0
+    rng = np.random.default_rng()
+    
+    # Against a server, one insert thread owns the client's single connection
+    # while this thread prepares the next batches; the embedded client
+    # inserts inline
+    executor = ThreadPoolExecutor(max_workers=1) if host and max_pending > 1 else None
+    pending: deque[tuple[Future, int]] = deque()
+    failed = threading.Event()
+    seen_ids: set[str] = set()
+    
+    # Key-derived ids are stable across runs, so existing records are updated
+    write = collection.upsert if id_column else collection.add
+    
+    def _write(kwargs: dict) -> None:
+        # Once a batch fails, skip the ones queued behind it
+        if failed.is_set():
+            return
+        try:
+            write(**kwargs)
+        except BaseException:
+            failed.set()
+            raise
+    
+    def _collect_oldest() -> None:
+        nonlocal total_imported
+        future, n = pending.popleft()
+        future.result()  # re-raise insert errors
+        total_imported += n
+        print(f"  Imported {total_imported} records")
+    
+    def _insert(**kwargs) -> None:
+        nonlocal total_imported
+        if executor is None:
+            write(**kwargs)
+            total_imported += len(kwargs["ids"])
+            print(f"  Imported {total_imported} records")
+            return
+        # Keep at most `max_pending` batches queued so huge files don't buffer
+        if len(pending) >= max_pending:
+            _collect_oldest()
+        pending.append((executor.submit(_write, kwargs), len(kwargs["ids"])))
     
-    for i in range(0, len(ids), batch_size):
-        batch_ids = ids[i:i+batch_size]
-        batch_meta = metadatas[i:i+batch_size]
-        
-        if vectorize_column and documents is not None:
-            batch_docs = documents[i:i+batch_size]
-            collection.add(
-                ids=batch_ids,
-                documents=batch_docs,
-                metadatas=batch_meta
-            )
-        else:
-            # Without vectorization, need to provide embeddings
-            # Using dummy embeddings (in real use, generate proper embeddings or skip)
-            import random
-            batch_embeddings = [[random.random() for _ in range(384)] for _ in range(len(batch_ids))]
-            collection.add(
-                ids=batch_ids,
-                embeddings=batch_embeddings,
-                metadatas=batch_meta
-            )
+    try:
+        for df in itertools.chain([first_chunk], chunks):
+            # Step 5: Prepare data (key ids come from the raw, uncleaned values)
+            if id_column:
+                if df[id_column].isna().any():
+                    raise ValueError(f"Column '{id_column}' has empty values; every row needs a key")
+                key_id_series = pd.Series(key_ids(df[id_column]), index=df.index)
+                # Repeated keys would silently overwrite rows, here or in earlier chunks
+                repeated = key_id_series.duplicated() | key_id_series.isin(seen_ids)
+                if repeated.any():
+                    raise ValueError(
+                        f"Column '{id_column}' has duplicate values (e.g. {df[id_column][repeated].iloc[0]!r}); "
+                        "every row needs a unique key"
+                    )
+                seen_ids.update(key_id_series)
+                ids = key_id_series.tolist()
+            else:
+                ids = generate_ids(len(df))
+            
+            df = clean_dataframe(df)
+            
+            documents: Optional[list[str]] = None
+            metadatas: list[dict]
+            
+            if vectorize_column:
+                documents = df[vectorize_column].astype(str).tolist()
+                metadatas = dataframe_records(df[metadata_columns])
+            else:
+                metadatas = dataframe_records(df)
+            
+            dummy_embeddings: Optional[np.ndarray] = None
+            if not vectorize_column:
+                # Without vectorization, need to provide embeddings
+                # Using dummy embeddings (in real use, generate proper embeddings or skip),
+                # drawn for the whole chunk in one numpy call
+                dummy_embeddings = rng.random((len(ids), 384), dtype=np.float32)
+            
+            # Step 6: Import in batches
+            for i in range(0, len(ids), batch_size):
+                batch_ids = ids[i:i+batch_size]
+                batch_meta = metadatas[i:i+batch_size]
+                
+                if vectorize_column and documents is not None:
+                    batch_docs = documents[i:i+batch_size]
+                    _insert(
+                        ids=batch_ids,
+                        documents=batch_docs,
+                        metadatas=batch_meta
+                    )
+                else:
+                    _insert(
+                        ids=batch_ids,
+                        embeddings=dummy_embeddings[i:i+batch_size].tolist(),
+                        metadatas=batch_meta
+                    )
         
-        total_imported += len(batch_ids)
-        print(f"  Imported {total_imported}/{len(ids)} records")
+        while pending:
+            _collect_oldest()
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
     
     # Step 7: Verify
     count = collection.count()
@@ -261,6 +497,12 @@ def main():
                                help="Collection name (default: derived from filename)")
     import_parser.add_argument("--batch-size", "-b", type=int, default=100,
                                help="Batch size for import (default: 100)")
+    import_parser.add_argument("--max-pending", type=int, default=4,
+                               help="Max prepared batches queued for the single insert thread in server mode; inserts are never parallel (default: 4, replaces --concurrency)")
+    import_parser.add_argument("--no-cache", dest="cache", action="store_false",
+                               help="Don't read or write the .seekdb.parquet cache for Excel files")
+    import_parser.add_argument("--id-column",
+                               help="Column with unique row keys; derives stable ids and upserts (default: random ids)")
     
     # Delete subcommand
     delete_parser = subparsers.add_parser(
@@ -281,7 +523,10 @@ def main():
                 file_path=args.file_path,
                 vectorize_column=args.vectorize_column,
                 collection_name=args.collection,
-                batch_size=args.batch_size
+                batch_size=args.batch_size,
+                max_pending=args.max_pending,
+                cache=args.cache,
+                id_column=args.id_column
             )
             print(f"\nSuccess! Collection '{collection_name}' now has {count} records.")
         
@@ -28,9 +28,10 @@ This script is designed for use in Claude Code (non-interactive environment).
 """
 
 import argparse
+import functools
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
 try:
     import pandas as pd
@@ -42,10 +43,30 @@ try:
     import openpyxl
 except ImportError:
     print("Warning: openpyxl is recommended for .xlsx files. Install with: pip install openpyxl")
+    openpyxl = None
 
+# Display options for previews, applied once in main()
+DISPLAY_OPTIONS = {
+    'display.max_columns': None,
+    'display.width': None,
+    'display.max_colwidth': 50,
+}
 
-def list_sheets(file_path: str) -> list[str]:
-    """List all sheet names in an Excel file."""
+
+@functools.lru_cache(maxsize=None)
+def _best_excel_engine() -> Optional[str]:
+    """Return "calamine" if python-calamine is usable, else None (pandas default engine)."""
+    try:
+        import python_calamine  # noqa: F401
+    except ImportError:
+        return None
+    # pandas gained the calamine engine in 2.2
+    major, minor = (int(x) for x in pd.__version__.split(".")[:2])
+    return "calamine" if (major, minor) >= (2, 2) else None
+
+
+def open_excel(file_path: str) -> pd.ExcelFile:
+    """Open an Excel file once so its sheets can be listed, sized and parsed."""
     path = Path(file_path)
     
     if not path.exists():
@@ -55,12 +76,20 @@ def list_sheets(file_path: str) -> list[str]:
     if suffix not in ['.xlsx', '.xls']:
         raise ValueError(f"Not an Excel file: {suffix}. Use .xlsx or .xls")
     
-    xl = pd.ExcelFile(file_path)
-    return xl.sheet_names
+    return pd.ExcelFile(file_path, engine=_best_excel_engine())
+
+
+def list_sheets(source: Union[str, pd.ExcelFile]) -> list[str]:
+    """List all sheet names in an Excel file (path or already opened pd.ExcelFile)."""
+    if isinstance(source, pd.ExcelFile):
+        return source.sheet_names
+    
+    with open_excel(source) as xl:
+        return xl.sheet_names
 
 
 def read_excel(
-    file_path: str,
+    source: Union[str, pd.ExcelFile],
     sheet_name: Optional[str] = None,
     nrows: Optional[int] = None
 ) -> pd.DataFrame:
@@ -68,13 +97,17 @@ def read_excel(
     Read an Excel file into a DataFrame.
     
     Args:
-        file_path: Path to Excel file
+        source: Path to Excel file, or a pd.ExcelFile from open_excel()
         sheet_name: Name of sheet to read (default: first sheet)
         nrows: Number of rows to read (default: all)
     
     Returns:
         DataFrame with Excel data
     """
+    if isinstance(source, pd.ExcelFile):
+        return source.parse(sheet_name or 0, nrows=nrows)
+    
+    file_path = source
     path = Path(file_path)
     
     if not path.exists():
@@ -85,14 +118,71 @@ def read_excel(
         raise ValueError(f"Not an Excel file: {suffix}. Use .xlsx or .xls")
     
     # Read the Excel file
+    engine = _best_excel_engine()
     if sheet_name:
-        df = pd.read_excel(file_path, sheet_name=sheet_name, nrows=nrows)
+        df = pd.read_excel(file_path, sheet_name=sheet_name, nrows=nrows, engine=engine)
     else:
-        df = pd.read_excel(file_path, nrows=nrows)
+        df = pd.read_excel(file_path, nrows=nrows, engine=engine)
     
     return df
 
 
+def sheet_dimensions(file_path: str, xl: Optional[pd.ExcelFile] = None) -> list[tuple[str, int, int]]:
+    """
+    Get (sheet name, data rows, columns) for every sheet without parsing cells.
+    
+    .xlsx sizes come from each worksheet's dimension record (openpyxl read-only
+    mode) and .xls sizes from xlrd's on-demand loader; the header row is not
+    counted. Sheets whose size can't be read that way are parsed with pandas.
+    When `xl` was opened with the openpyxl or xlrd engine its workbook is reused.
+    """
+    suffix = Path(file_path).suffix.lower()
+    sizes: dict[str, Optional[tuple[int, int]]] = {}
+    shared_book = xl.book if xl is not None and xl.engine in ('openpyxl', 'xlrd') else None
+    
+    if suffix == '.xlsx' and openpyxl is not None:
+        # pandas opens openpyxl workbooks read-only as well
+        wb = shared_book or openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            for name in wb.sheetnames:
+                ws = wb[name]
+                # Missing or single-cell dimensions are ambiguous; parse those
+                if ws.max_row is None or ws.max_column is None or ws.max_row <= 1:
+                    sizes[name] = None
+                else:
+                    sizes[name] = (ws.max_row - 1, ws.max_column)
+        finally:
+            if wb is not shared_book:
+                wb.close()
+    elif suffix == '.xls':
+        try:
+            import xlrd
+        except ImportError:
+            xlrd = None
+        if xlrd is not None:
+            book = shared_book or xlrd.open_workbook(file_path, on_demand=True)
+            try:
+                for name in book.sheet_names():
+                    sheet = book.sheet_by_name(name)
+                    sizes[name] = (sheet.nrows - 1, sheet.ncols) if sheet.nrows > 1 else None
+                    if book is not shared_book:
+                        book.unload_sheet(name)
+            finally:
+                if book is not shared_book:
+                    book.release_resources()
+    
+    if not sizes:
+        sizes = dict.fromkeys(list_sheets(xl if xl is not None else file_path))
+    
+    dims = []
+    for name, size in sizes.items():
+        if size is None:
+            df = read_excel(xl if xl is not None else file_path, sheet_name=name)
+            size = (len(df), len(df.columns))
+        dims.append((name, *size))
+    return dims
+
+
 def print_file_info(file_path: str):
     """Print basic file information."""
     path = Path(file_path)
@@ -113,29 +203,20 @@ def print_file_info(file_path: str):
     print(f"{'='*60}")
 
 
-def print_sheet_info(file_path: str):
+def print_sheet_info(file_path: str, xl: Optional[pd.ExcelFile] = None):
     """Print information about all sheets in the file."""
-    sheets = list_sheets(file_path)
-    print(f"\nSheets ({len(sheets)} total):")
+    dims = sheet_dimensions(file_path, xl)
+    print(f"\nSheets ({len(dims)} total):")
     
-    xl = pd.ExcelFile(file_path)
-    for i, sheet in enumerate(sheets, 1):
-        df = xl.parse(sheet)
-        print(f"  {i}. {sheet} - {len(df)} rows x {len(df.columns)} columns")
+    for i, (sheet, rows, cols) in enumerate(dims, 1):
+        print(f"  {i}. {sheet} - {rows} rows x {cols} columns")
 
 
 def print_data_preview(df: pd.DataFrame, max_rows: int = 5):
     """Print a preview of the DataFrame."""
     print(f"\nData Preview (showing {min(len(df), max_rows)} of {len(df)} rows):")
     print("-" * 60)
-    
-    # Set pandas display options for better output
-    with pd.option_context(
-        'display.max_columns', None,
-        'display.width', None,
-        'display.max_colwidth', 50
-    ):
-        print(df.head(max_rows).to_string(index=True))
+    print(df.head(max_rows).to_string(index=True))
 
 
 def print_column_info(df: pd.DataFrame):
@@ -162,11 +243,8 @@ def print_statistics(df: pd.DataFrame):
     print(f"\nStatistics (numeric columns only):")
     print("-" * 60)
     
-    with pd.option_context(
-        'display.max_columns', None,
-        'display.width', None,
-        'display.float_format', '{:.2f}'.format
-    ):
+    # float_format stays local so it doesn't leak into the data preview
+    with pd.option_context('display.float_format', '{:.2f}'.format):
         print(df[numeric_cols].describe().to_string())
 
 
@@ -201,47 +279,53 @@ def main():
     
     args = parser.parse_args()
     
+    # Set pandas display options for better output
+    for option, value in DISPLAY_OPTIONS.items():
+        pd.set_option(option, value)
+    
     try:
         # Print file info
         print_file_info(args.file_path)
         
-        # List sheets
-        if args.list_sheets:
-            print_sheet_info(args.file_path)
-            return
-        
-        # Print sheet info
-        print_sheet_info(args.file_path)
-        
-        # Read the data
-        if args.sheet:
-            print(f"\nReading sheet: {args.sheet}")
-        else:
-            sheets = list_sheets(args.file_path)
-            print(f"\nReading sheet: {sheets[0]} (first sheet)")
-        
-        # Read all rows or limited rows based on options
-        nrows = None if args.all_rows or args.to_csv else None
-        df = read_excel(args.file_path, sheet_name=args.sheet, nrows=nrows)
-        
-        print(f"Total: {len(df)} rows x {len(df.columns)} columns")
-        
-        # Show column info if requested
-        if args.columns:
-            print_column_info(df)
-        
-        # Print preview
-        preview_rows = len(df) if args.all_rows else args.rows
-        print_data_preview(df, max_rows=preview_rows)
-        
-        # Show statistics if requested
-        if args.stats:
-            print_statistics(df)
-        
-        # Export to CSV if requested
-        if args.to_csv:
-            export_to_csv(df, args.to_csv)
-        
+        # Open the workbook once and share it across listing, sizing and reading
+        with open_excel(args.file_path) as xl:
+            # List sheets
+            if args.list_sheets:
+                print_sheet_info(args.file_path, xl)
+                return
+            
+            # Print sheet info
+            print_sheet_info(args.file_path, xl)
+            
+            # Read the data
+            if args.sheet:
+                print(f"\nReading sheet: {args.sheet}")
+            else:
+                sheets = list_sheets(xl)
+                print(f"\nReading sheet: {sheets[0]} (first sheet)")
+            
+            # Read all rows or limited rows based on options
+            nrows = None if args.all_rows or args.to_csv else None
+            df = read_excel(xl, sheet_name=args.sheet, nrows=nrows)
+            
+            print(f"Total: {len(df)} rows x {len(df.columns)} columns")
+            
+            # Show column info if requested
+            if args.columns:
+                print_column_info(df)
+            
+            # Print preview
+            preview_rows = len(df) if args.all_rows else args.rows
+            print_data_preview(df, max_rows=preview_rows)
+            
+            # Show statistics if requested
+            if args.stats:
+                print_statistics(df)
+            
+            # Export to CSV if requested
+            if args.to_csv:
+                export_to_csv(df, args.to_csv)
+            
         print()
         
     except FileNotFoundError as e:
@@ -13,6 +13,7 @@ Usage:
     python query_from_seekdb.py <collection_name> --query-text <text> --output results.csv
     python query_from_seekdb.py --list-collections
     python query_from_seekdb.py <collection_name> --info
+    python query_from_seekdb.py --info-all
 
 Examples:
     # 1. Scalar search (metadata filter only)
@@ -24,6 +25,9 @@ Examples:
     # 3. Scalar + Hybrid search (metadata filter + fulltext + semantic)
     python query_from_seekdb.py mobiles --query-text "budget phone" --where '{"Brand": {"$eq": "SAMSUNG"}}'
     
+    # Several hybrid searches in one run, one --query-text each
+    python query_from_seekdb.py mobiles --query-text "budget phone" --query-text "good camera"
+    
     # Export query results to CSV
     python query_from_seekdb.py mobiles --query-text "phone with good battery" --output results.csv
     
@@ -35,14 +39,23 @@ Examples:
     
     # Show collection info
     python query_from_seekdb.py mobiles --info
+
+    # Show info for every collection
+    python query_from_seekdb.py --info-all
 """
 
 import argparse
+import atexit
+import functools
 import json
 import os
+import pickle
 import sys
+import tempfile
+from datetime import date, datetime, time
+from itertools import zip_longest
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterable, Iterator, Optional
 
 try:
     from dotenv import load_dotenv
@@ -50,65 +63,174 @@ try:
 except ImportError:
     pass  # dotenv is optional, will use environment variables directly
 
-try:
-    import pyseekdb
-except ImportError:
-    print("Error: pyseekdb is required. Install with: pip install pyseekdb")
-    sys.exit(1)
+# pandas is optional, only required for export. It is imported lazily by
+# _require_pandas() so list/info/search paths don't pay its import cost.
+pd = None
 
-# pandas is optional, only required for export
-pandas_available = False
+# orjson is optional, used for faster --json output and --where parsing
 try:
-    import pandas as pd
-    pandas_available = True
+    import orjson
 except ImportError:
-    pass
-
-
-# Initialize client based on environment
-host = os.getenv("SEEKDB_HOST")
-if host:
-    # Server mode
-    client = pyseekdb.Client(
-        host=host,
-        port=int(os.getenv("SEEKDB_PORT", "2881")),
-        database=os.getenv("SEEKDB_DATABASE", "test"),
-        user=os.getenv("SEEKDB_USER", "root"),
-        password=os.getenv("SEEKDB_PASSWORD", "")
-    )
-else:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+# catch the stdlib exception either way
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+@functools.lru_cache(maxsize=None)
+def _client():
+    """
+    Create the seekdb client on first use.
+
+    Deferred so --help and argument errors don't import pyseekdb or touch
+    the filesystem.
+    """
+    try:
+        import pyseekdb
+    except ImportError:
+        print("Error: pyseekdb is required. Install with: pip install pyseekdb")
+        sys.exit(1)
+
+    # Initialize client based on environment
+    host = os.getenv("SEEKDB_HOST")
+    if host:
+        # Server mode
+        return pyseekdb.Client(
+            host=host,
+            port=int(os.getenv("SEEKDB_PORT", "2881")),
+            database=os.getenv("SEEKDB_DATABASE", "test"),
+            user=os.getenv("SEEKDB_USER", "root"),
+            password=os.getenv("SEEKDB_PASSWORD", "")
+        )
+
     # Embedded mode
-    seekdb_path = os.path.expanduser("~/.seekdb")
+    seekdb_path = Path.home() / ".seekdb"
     # Ensure directory exists
-    os.makedirs(seekdb_path, exist_ok=True)
-    client = pyseekdb.Client(path=seekdb_path)
+    if not seekdb_path.exists():
+        seekdb_path.mkdir(parents=True)
+    return pyseekdb.Client(path=str(seekdb_path))
+
+
+def __getattr__(name: str):
+    # Keep `from query_from_seekdb import client` working with the lazy client
+    if name == "client":
+        return _client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Collection handles already fetched in this process, keyed by name. Each
+# CLI run is one process and never drops or recreates a collection, so
+# entries are not invalidated; long-lived callers that do should clear it.
+_COLLECTION_CACHE: dict[str, Any] = {}
+
+
+def _reset_after_fork():
+    """Drop the inherited client and handles so a forked child reconnects."""
+    _client.cache_clear()
+    _COLLECTION_CACHE.clear()
+
+
+def _close_client():
+    """Close the client at exit, if one was created and supports closing."""
+    if _client.cache_info().currsize:
+        close = getattr(_client(), "close", None)
+        if close is not None:
+            close()
+
+
+# A client shared across fork() would share its connection with the parent
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+atexit.register(_close_client)
+
+
+def _require_pandas():
+    """Import pandas on first use and return the module."""
+    global pd
+    if pd is None:
+        try:
+            import pandas
+        except ImportError:
+            raise ImportError(
+                "pandas is required for export. Install with: pip install pandas openpyxl")
+        pd = pandas
+    return pd
 
 
 def get_collection(collection_name: str):
-    """Get a collection from seekdb."""
-    if not client.has_collection(collection_name):
+    """Get a collection from seekdb, reusing the handle on repeated calls."""
+    collection = _COLLECTION_CACHE.get(collection_name)
+    if collection is not None:
+        return collection
+
+    client = _client()
+    # One round trip; pyseekdb raises ValueError for a missing collection,
+    # other errors (connection, permissions) propagate unchanged
+    try:
+        collection = client.get_collection(name=collection_name)
+    except ValueError as e:
         raise ValueError(
-            f"Collection '{collection_name}' not found. Available collections: {client.list_collections()}")
-    return client.get_collection(name=collection_name)
+            f"Collection '{collection_name}' not found ({e}). "
+            f"Available collections: {client.list_collections()}") from e
 
+    _COLLECTION_CACHE[collection_name] = collection
+    return collection
 
-def get_by_filter(
+
+# Largest limit requested from the server in one collection.get() call;
+# scalar searches for more (or all) matches are fetched page by page
+GET_PAGE_SIZE = 10_000
+
+
+def _iter_get_pages(collection, get_params: dict, n_results: Optional[int] = None,
+                    offset: int = 0, page_size: int = GET_PAGE_SIZE) -> Iterator[dict]:
+    """
+    Yield collection.get() pages of at most page_size records.
+
+    Stops after n_results records (None: no limit) or at the first short
+    page. get_params is built once by the caller; only limit/offset change
+    between pages.
+    """
+    params = dict(get_params)
+    fetched = 0
+    while n_results is None or fetched < n_results:
+        limit = page_size if n_results is None else min(page_size, n_results - fetched)
+        params["limit"] = limit
+        params["offset"] = offset + fetched
+        page = collection.get(**params)
+        yield page
+        count = len(page.get("ids") or [])
+        fetched += count
+        if count < limit:
+            break
+
+
+def iter_by_filter(
     collection_name: str,
     where: Optional[dict] = None,
     where_document: Optional[dict] = None,
-    include: Optional[list] = None
-) -> dict:
+    include: Optional[list] = None,
+    n_results: Optional[int] = None,
+    offset: Optional[int] = None
+) -> Iterator[dict]:
     """
-    Perform scalar/metadata filter search using collection.get().
+    Yield scalar/metadata filter matches page by page using collection.get().
+
+    Each page holds at most GET_PAGE_SIZE records, so no single round trip
+    carries the whole result set and callers can process a page before the
+    next one is fetched.
 
     Args:
         collection_name: Name of the collection to query
         where: Metadata filter conditions
         where_document: Document filter conditions (fulltext search)
         include: List of fields to include in results
+        n_results: Maximum number of results to return (default: all matches)
+        offset: Number of matching results to skip, for pagination
 
-    Returns:
-        Query results dictionary with ids, documents, metadatas
+    Yields:
+        collection.get() results (flat ids, documents, metadatas lists)
     """
     collection = get_collection(collection_name)
 
@@ -122,11 +244,46 @@ def get_by_filter(
         get_params["include"] = include
     else:
         get_params["include"] = ["documents", "metadatas"]
+    yield from _iter_get_pages(collection, get_params, n_results,
+                               offset or 0, GET_PAGE_SIZE)
 
-    # collection.get() returns flat structure, convert to nested for consistency
-    result = collection.get(**get_params)
 
-    # Convert flat structure to nested structure (same as query results)
+def get_by_filter(
+    collection_name: str,
+    where: Optional[dict] = None,
+    where_document: Optional[dict] = None,
+    include: Optional[list] = None,
+    n_results: Optional[int] = None,
+    offset: Optional[int] = None
+) -> dict:
+    """
+    Perform scalar/metadata filter search using collection.get().
+
+    Matches are fetched in pages (see iter_by_filter) and merged.
+
+    Args:
+        collection_name: Name of the collection to query
+        where: Metadata filter conditions
+        where_document: Document filter conditions (fulltext search)
+        include: List of fields to include in results
+        n_results: Maximum number of results to return (default: all matches)
+        offset: Number of matching results to skip, for pagination
+
+    Returns:
+        Query results dictionary with ids, documents, metadatas, nested
+        like query results (one list per field inside a one-element list)
+    """
+    result: dict = {}
+    for page in iter_by_filter(collection_name, where, where_document,
+                               include, n_results, offset):
+        for key, values in page.items():
+            if isinstance(values, list):
+                result.setdefault(key, []).extend(values)
+            else:
+                result.setdefault(key, values)
+
+    # collection.get() returns flat structure, convert to nested for consistency
+    # (same as query results)
     return {
         "ids": [result.get("ids", [])],
         "documents": [result.get("documents", [])] if result.get("documents") else None,
@@ -140,7 +297,8 @@ def hybrid_search(
     query_text: str,
     n_results: int = 5,
     where: Optional[dict] = None,
-    include: Optional[list] = None
+    include: Optional[list] = None,
+    rrf_k: int = 60
 ) -> dict:
     """
     Perform hybrid search combining fulltext and semantic similarity search.
@@ -155,6 +313,8 @@ def hybrid_search(
         n_results: Number of results to return
         where: Metadata filter conditions
         include: List of fields to include in results
+        rrf_k: RRF rank constant k; each result scores 1 / (k + rank) per
+            sub-query, so smaller k favours top-ranked hits more strongly
 
     Returns:
         Query results dictionary with ids, documents, metadatas, distances
@@ -171,8 +331,8 @@ def hybrid_search(
     if where:
         knn["where"] = where
 
-    # Rank fusion
-    rank = {"rrf": {}}
+    # Rank fusion (Reciprocal Rank Fusion with an explicit rank constant)
+    rank = {"rrf": {"rank_constant": rrf_k}}
 
     # Include fields
     include_fields = include if include else ["documents", "metadatas"]
@@ -186,6 +346,94 @@ def hybrid_search(
     )
 
 
+def hybrid_search_many(
+    collection_name: str,
+    query_texts: list[str],
+    **kwargs
+) -> list[dict]:
+    """
+    Run hybrid_search for each query text, sharing one client and collection.
+
+    Like --info-all, searches run one after another: the client holds a
+    single connection, which is not shared between threads.
+
+    Args:
+        collection_name: Name of the collection to query
+        query_texts: Query texts, each used for fulltext and semantic search
+        **kwargs: Passed through to hybrid_search (n_results, where, ...)
+
+    Returns:
+        One results dictionary per query text, in input order
+    """
+    return [hybrid_search(collection_name, text, **kwargs) for text in query_texts]
+
+
+def _field(results: dict, key: str) -> list:
+    """Return a result field as a flat list, accepting flat or nested shapes."""
+    value = results.get(key)
+    if not value:
+        return []
+    # Query results have nested lists (one list per query), use the first
+    if isinstance(value[0], list):
+        return value[0]
+    return value
+
+
+def _unpack(results: dict) -> tuple[list, list, list, list]:
+    """
+    Extract (ids, distances, documents, metadatas) from a results dictionary.
+
+    Accepts both the flat shape returned by collection.get() and the nested
+    shape returned by query/hybrid_search. Missing or None fields become
+    empty lists.
+    """
+    return (
+        _field(results, "ids"),
+        _field(results, "distances"),
+        _field(results, "documents"),
+        _field(results, "metadatas"),
+    )
+
+
+def _results_to_columns(results: dict) -> dict[str, list]:
+    """
+    Convert query results to a column-name -> values mapping.
+
+    Columns are id, distance, document, followed by the union of metadata
+    keys in first-seen order. Missing values are None.
+
+    Args:
+        results: Query results dictionary
+
+    Returns:
+        Dictionary of equal-length column lists (empty if there are no results)
+    """
+    ids, distances, documents, metadatas = _unpack(results)
+    if not ids:
+        return {}
+
+    n = len(ids)
+
+    # Build column-wise so each column is allocated once as a single array
+    data = {"id": ids}
+
+    if distances:
+        data["distance"] = list(distances[:n]) + [None] * (n - len(distances))
+
+    if documents:
+        docs = [doc or None for doc in documents[:n]]
+        data["document"] = docs + [None] * (n - len(docs))
+
+    if metadatas:
+        metas = [m or {} for m in metadatas[:n]]
+        metas += [{}] * (n - len(metas))
+        # Union of metadata keys, preserving first-seen order
+        for key in dict.fromkeys(k for m in metas for k in m):
+            data[key] = [m.get(key) for m in metas]
+
+    return data
+
+
 def results_to_dataframe(results: dict) -> "pd.DataFrame":
     """
     Convert query results to pandas DataFrame.
@@ -196,44 +444,268 @@ def results_to_dataframe(results: dict) -> "pd.DataFrame":
     Returns:
         DataFrame with all data flattened
     """
-    if not pandas_available:
-        raise ImportError(
-            "pandas is required for export. Install with: pip install pandas openpyxl")
+    pd = _require_pandas()
 
-    import pandas as pd  # Import here since we've confirmed it's available
+    data = _results_to_columns(results)
+    if not data:
+        return pd.DataFrame()
 
-    rows = []
+    return pd.DataFrame(data, copy=False)
 
-    # Query results have nested lists
-    if not results.get("ids") or not results["ids"][0]:
-        return pd.DataFrame()
 
-    ids = results["ids"][0]
-    distances = results.get("distances", [[]])[0]
-    documents = results.get("documents", [[]])[
-        0] if results.get("documents") else []
-    metadatas = results.get("metadatas", [[]])[
-        0] if results.get("metadatas") else []
+def _export_with_polars(results: dict, output_path: str,
+                        sheet_name: str = "Data") -> bool:
+    """
+    Export query results to Excel with polars, skipping the pandas intermediate.
 
-    for i, id_ in enumerate(ids):
-        row = {"id": id_}
+    Cells are converted with _xlsx_cell first, as in _write_xlsx_fast.
 
-        if distances and i < len(distances):
-            row["distance"] = distances[i]
+    Args:
+        results: Query results dictionary (must be non-empty)
+        output_path: Output file path (.xlsx)
+        sheet_name: Sheet name for the workbook
 
-        if documents and i < len(documents) and documents[i]:
-            row["document"] = documents[i]
+    Returns:
+        True if the file was written; False if polars (or the xlsxwriter
+        package it writes Excel through) is not installed or polars rejected
+        the data, in which case the caller should fall back
+    """
+    try:
+        import polars as pl
+    except ImportError:
+        return False
 
-        if metadatas and i < len(metadatas) and metadatas[i]:
-            for key, value in metadatas[i].items():
-                row[key] = value
+    columns = {key: [_xlsx_cell(v) for v in values]
+               for key, values in _results_to_columns(results).items()}
+    try:
+        pl.DataFrame(columns, strict=False).write_excel(output_path, worksheet=sheet_name)
+    except (ImportError, pl.exceptions.PolarsError):
+        return False
+    return True
 
-        rows.append(row)
 
-    return pd.DataFrame(rows)
+def _csv_field(value) -> bytes:
+    """Encode a single CSV field, quoting only when the value requires it."""
+    if value is None:
+        return b""
+    text = value if isinstance(value, str) else str(value)
+    if '"' in text or ',' in text or '\n' in text or '\r' in text:
+        text = '"' + text.replace('"', '""') + '"'
+    return text.encode("utf-8")
 
 
-def export_to_file(df, output_path: str, sheet_name: str = "Data") -> str:
+def _write_csv_rows(header: list, rows: Iterable, output_path: str,
+                   bom: bool = True) -> None:
+    """
+    Write a header and rows to a CSV file; the only CSV writer in this module.
+
+    Fields are formatted by _csv_field (None as an empty field, everything
+    else as str()), lines end with "\n" on every platform. pyarrow.csv is
+    deliberately not used: it quotes every string, writes True as "true" and
+    1e-07 as "1e-7", and rejects list/dict metadata columns, so the same
+    results would export differently depending on what is installed.
+
+    Args:
+        header: Column names
+        rows: Iterable of row sequences, aligned with header
+        output_path: Output file path
+        bom: Write a UTF-8 BOM so Excel detects the encoding
+    """
+    field = _csv_field
+    # Large write buffer to keep syscalls down on big exports
+    with open(output_path, "wb", buffering=1 << 20) as f:
+        if bom:
+            f.write(b"\xef\xbb\xbf")
+        f.write(b",".join(map(field, header)) + b"\n")
+        for row in rows:
+            f.write(b",".join(map(field, row)) + b"\n")
+
+
+def _csv_header(meta_keys: list, has_dist: bool, has_docs: bool) -> list:
+    """Return the CSV header: id, distance, document, then metadata keys."""
+    header = ["id"]
+    if has_dist:
+        header.append("distance")
+    if has_docs:
+        header.append("document")
+    header.extend(meta_keys)
+    return header
+
+
+def _csv_result_rows(fields: tuple, meta_keys: list,
+                     has_dist: bool, has_docs: bool) -> Iterator[list]:
+    """Yield CSV rows for unpacked (ids, distances, documents, metadatas)."""
+    ids, distances, documents, metadatas = fields
+    n = len(ids)
+    # Walk the fields in lockstep; shorter fields are padded with None
+    for id_, dist, doc, meta in zip_longest(ids, distances[:n], documents[:n], metadatas[:n]):
+        row = [id_]
+        if has_dist:
+            row.append(dist)
+        if has_docs:
+            row.append(doc)
+        if meta:
+            row.extend(meta.get(k) for k in meta_keys)
+        else:
+            row.extend([None] * len(meta_keys))
+        yield row
+
+
+def _write_csv_streaming(results: dict, output_path: str, bom: bool = True) -> int:
+    """
+    Write query results straight to a CSV file without building a DataFrame.
+
+    Columns match results_to_dataframe: id, distance, document, followed by
+    the union of metadata keys in first-seen order.
+
+    Args:
+        results: Query results dictionary
+        output_path: Output file path
+        bom: Write a UTF-8 BOM so Excel detects the encoding
+
+    Returns:
+        Number of records written
+    """
+    fields = _unpack(results)
+    ids, distances, documents, metadatas = fields
+
+    # Union of metadata keys, preserving first-seen order
+    meta_keys = list(dict.fromkeys(k for m in metadatas if m for k in m))
+    has_dist = bool(distances)
+    has_docs = bool(documents)
+
+    header = _csv_header(meta_keys, has_dist, has_docs)
+    rows = _csv_result_rows(fields, meta_keys, has_dist, has_docs)
+    _write_csv_rows(header, rows, output_path, bom=bom)
+    return len(ids)
+
+
+def _write_csv_pages(pages: Iterable[dict], output_path: str, bom: bool = True) -> int:
+    """
+    Write result pages (e.g. from iter_by_filter) to a CSV file.
+
+    Only one page is held in memory at a time. The header needs the union
+    of metadata keys over every page, so pages are first spooled to a
+    temporary file and the CSV is written once the last page has arrived;
+    the bytes match _write_csv_streaming on the merged results.
+
+    Args:
+        pages: Iterable of results dictionaries
+        output_path: Output file path
+        bom: Write a UTF-8 BOM so Excel detects the encoding
+
+    Returns:
+        Number of records written; with no records, no file is written
+    """
+    meta_keys: dict = {}
+    has_dist = has_docs = False
+    n = n_pages = 0
+    with tempfile.TemporaryFile() as spool:
+        for page in pages:
+            fields = _unpack(page)
+            if not fields[0]:
+                continue
+            ids, distances, documents, metadatas = fields
+            meta_keys.update(dict.fromkeys(k for m in metadatas if m for k in m))
+            has_dist = has_dist or bool(distances)
+            has_docs = has_docs or bool(documents)
+            n += len(ids)
+            n_pages += 1
+            pickle.dump(fields, spool, protocol=pickle.HIGHEST_PROTOCOL)
+        if not n:
+            return 0
+
+        keys = list(meta_keys)
+        spool.seek(0)
+
+        def rows():
+            for _ in range(n_pages):
+                yield from _csv_result_rows(pickle.load(spool), keys, has_dist, has_docs)
+
+        _write_csv_rows(_csv_header(keys, has_dist, has_docs), rows(), output_path, bom=bom)
+    return n
+
+
+# Cell value types the Excel writers handle natively
+_XLSX_CELL_TYPES = (str, int, float, bool, date, datetime, time)
+
+
+def _xlsx_cell(value):
+    """Return value as an Excel cell value, stringifying lists, dicts, etc."""
+    if isinstance(value, _XLSX_CELL_TYPES):
+        # NaN and NaT are the only values unequal to themselves; write blanks
+        return value if value == value else None
+    if value is None or (pd is not None and value is pd.NA):
+        return None
+    if getattr(value, "ndim", None) == 0 and hasattr(value, "item"):
+        # numpy scalar (e.g. a nullable Int64 value); convert to its Python value
+        return _xlsx_cell(value.item())
+    return str(value)
+
+
+def _write_xlsx_fast(df, output_path: str, sheet_name: str = "Data") -> None:
+    """
+    Write DataFrame to an Excel file using the fastest available writer.
+
+    Prefers pyexcelerate, which needs every row up front, then xlsxwriter in
+    constant_memory mode, and finally an openpyxl write-only workbook. The
+    last two convert and write one row at a time, so only the workbook
+    writer's own buffers are held in memory.
+
+    Args:
+        df: DataFrame to write
+        output_path: Output file path
+        sheet_name: Sheet name for the workbook
+    """
+    header = [str(col) for col in df.columns]
+    cell = _xlsx_cell
+
+    def rows():
+        # NaN/NaT are not valid cell values for the native writers, write
+        # blanks instead; non-scalar metadata (lists, dicts) is stringified
+        for row in df.itertuples(index=False, name=None):
+            yield [cell(v) for v in row]
+
+    try:
+        from pyexcelerate import Workbook
+    except ImportError:
+        Workbook = None
+
+    if Workbook is not None:
+        wb = Workbook()
+        wb.new_sheet(sheet_name, data=[header, *rows()])
+        wb.save(output_path)
+        return
+
+    try:
+        import xlsxwriter
+    except ImportError:
+        xlsxwriter = None
+
+    if xlsxwriter is not None:
+        wb = xlsxwriter.Workbook(
+            output_path, {"constant_memory": True, "strings_to_urls": False})
+        try:
+            ws = wb.add_worksheet(sheet_name)
+            ws.write_row(0, 0, header)
+            for i, row in enumerate(rows(), 1):
+                ws.write_row(i, 0, row)
+        finally:
+            wb.close()
+        return
+
+    from openpyxl import Workbook as OpenpyxlWorkbook
+
+    wb = OpenpyxlWorkbook(write_only=True)
+    ws = wb.create_sheet(sheet_name)
+    ws.append(header)
+    for row in rows():
+        ws.append(row)
+    wb.save(output_path)
+
+
+def export_to_file(df, output_path: str, sheet_name: str = "Data",
+                   bom: bool = True) -> str:
     """
     Export DataFrame to CSV or Excel file.
 
@@ -241,13 +713,12 @@ def export_to_file(df, output_path: str, sheet_name: str = "Data") -> str:
         df: DataFrame to export
         output_path: Output file path (.csv or .xlsx)
         sheet_name: Sheet name for Excel export
+        bom: Write a UTF-8 BOM at the start of CSV files
 
     Returns:
         Absolute path to the exported file
     """
-    if not pandas_available:
-        raise ImportError(
-            "pandas is required for export. Install with: pip install pandas openpyxl")
+    _require_pandas()
 
     path = Path(output_path)
     suffix = path.suffix.lower()
@@ -256,10 +727,11 @@ def export_to_file(df, output_path: str, sheet_name: str = "Data") -> str:
     path.parent.mkdir(parents=True, exist_ok=True)
 
     if suffix == '.csv':
-        df.to_csv(output_path, index=False, encoding='utf-8-sig')
+        # Same writer as the CLI's CSV export; NaN/NaT become empty fields
+        rows = df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+        _write_csv_rows([str(col) for col in df.columns], rows, output_path, bom=bom)
     elif suffix in ['.xlsx', '.xls']:
-        df.to_excel(output_path, index=False,
-                    sheet_name=sheet_name, engine='openpyxl')
+        _write_xlsx_fast(df, output_path, sheet_name=sheet_name)
     else:
         raise ValueError(
             f"Unsupported file format: {suffix}. Use .csv or .xlsx")
@@ -267,40 +739,66 @@ def export_to_file(df, output_path: str, sheet_name: str = "Data") -> str:
     return str(path.absolute())
 
 
+# Per-result line templates for print_results
+RESULT_HEADER_TMPL = "\n[Result {i}]\n  ID: {id}"
+DISTANCE_TMPL = "  Distance: {}"
+DOCUMENT_TMPL = "  Document: {}"
+
+
+def _truncate(text: str, max_len: int) -> str:
+    """Truncate text to max_len characters, appending '...' if cut."""
+    return text if len(text) <= max_len else text[:max_len] + "..."
+
+
+@functools.lru_cache(maxsize=4096, typed=True)
+def _format_meta_value(value, max_len: int = 100) -> str:
+    """Stringify and truncate a metadata value (memoized for repeated values)."""
+    return _truncate(str(value), max_len)
+
+
 def print_results(results: dict):
     """Pretty print query results."""
-    # Query results have nested lists
-    if not results.get("ids") or not results["ids"][0]:
+    ids, distances, documents, metadatas = _unpack(results)
+    if not ids:
         print("No results found.")
         return
 
-    ids = results["ids"][0]
-    distances = results.get("distances", [[]])[0]
-    documents = results.get("documents", [[]])[
-        0] if results.get("documents") else []
-    metadatas = results.get("metadatas", [[]])[
-        0] if results.get("metadatas") else []
-
-    print(f"\nFound {len(ids)} results:\n")
-    print("=" * 80)
-
-    for i, id_ in enumerate(ids):
-        print(f"\n[Result {i + 1}]")
-        print(f"  ID: {id_}")
-        if distances and i < len(distances):
-            print(f"  Distance: {distances[i]:.4f}")
-        if documents and i < len(documents) and documents[i]:
-            doc = documents[i]
-            if len(doc) > 200:
-                doc = doc[:200] + "..."
-            print(f"  Document: {doc}")
-        if metadatas and i < len(metadatas) and metadatas[i]:
-            print(f"  Metadata:")
-            for key, value in metadatas[i].items():
-                val_str = str(value)
-                if len(val_str) > 100:
-                    val_str = val_str[:100] + "..."
-                print(f"    - {key}: {val_str}")
+    # Discover the metadata key schema once instead of per row
+    meta_keys = tuple(dict.fromkeys(k for m in metadatas if m for k in m))
+    key_width = max((len(str(k)) for k in meta_keys), default=0)
+
+    # Collect all output lines and emit them with a single write
+    lines = [f"\nFound {len(ids)} results:\n", "=" * 80]
+    append = lines.append
+
+    # Hoist helper lookups out of the loop, and format all distances in one
+    # pass rather than inside the row loop
+    n = len(ids)
+    dist_strs = [DISTANCE_TMPL.format(f"{d:.4f}") for d in distances[:n]]
+    truncate = _truncate
+    format_value = _format_meta_value
+
+    # Walk the fields in lockstep; shorter fields are padded with None
+    rows = zip_longest(ids, dist_strs, documents[:n], metadatas[:n])
+    for i, (id_, dist_str, doc, meta) in enumerate(rows, 1):
+        append(RESULT_HEADER_TMPL.format(i=i, id=id_))
+        if dist_str is not None:
+            append(dist_str)
+        if doc:
+            append(DOCUMENT_TMPL.format(truncate(doc, 200)))
+        if meta:
+            append("  Metadata:")
+            for key in meta_keys:
+                if key not in meta:
+                    continue
+                value = meta[key]
+                try:
+                    val_str = format_value(value)
+                except TypeError:  # unhashable values (lists, dicts)
+                    val_str = truncate(str(value), 100)
+                append(f"    - {str(key):<{key_width}}: {val_str}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def list_collections():
@@ -309,36 +807,23 @@ def list_collections():
     Returns:
         List of collection objects
     """
-    collections = client.list_collections()
+    collections = _client().list_collections()
     if not collections:
         print("No collections found.")
         return []
 
-    print("\nAvailable collections:")
-    for col in collections:
-        if hasattr(col, 'name'):
-            print(f"  - {col.name}")
-        else:
-            print(f"  - {col}")
+    # Build the listing once and emit it with a single write
+    names = (col.name if hasattr(col, 'name') else str(col) for col in collections)
+    sys.stdout.write("\nAvailable collections:\n  - " + "\n  - ".join(names) + "\n")
     
     return collections
 
 
-def collection_info(collection_name: str) -> dict:
-    """Get information about a collection.
-    
-    Args:
-        collection_name: Name of the collection
-        
-    Returns:
-        Dictionary with collection info: name, count, preview
-    """
+def _fetch_collection_info(collection_name: str) -> dict:
+    """Fetch count and a 3-record preview of a collection, without printing."""
     collection = get_collection(collection_name)
     count = collection.count()
 
-    print(f"\nCollection: {collection_name}")
-    print(f"  Total records: {count}")
-
     info = {
         "name": collection_name,
         "count": count,
@@ -347,24 +832,86 @@ def collection_info(collection_name: str) -> dict:
 
     # Preview some data
     if count > 0:
-        preview = collection.peek(limit=3)
-        info["preview"] = preview
-        print(f"\nPreview (first 3 records):")
-        for i in range(len(preview['ids'])):
-            print(f"  ID: {preview['ids'][i][:20]}...")
-            if preview.get('documents') and preview['documents'][i]:
-                doc = preview['documents'][i][:50] + "..." if len(
-                    preview['documents'][i]) > 50 else preview['documents'][i]
-                print(f"    Document: {doc}")
-            if preview.get('metadatas') and preview['metadatas'][i]:
-                print(
-                    f"    Metadata keys: {list(preview['metadatas'][i].keys())}")
+        info["preview"] = collection.peek(limit=3)
+
+    return info
+
+
+def _print_collection_info(info: dict):
+    """Print collection info as returned by _fetch_collection_info."""
+    lines = [f"\nCollection: {info['name']}", f"  Total records: {info['count']}"]
+    append = lines.append
+
+    preview = info["preview"]
+    if preview is not None:
+        append(f"\nPreview (first 3 records):")
+        # Look the preview fields up once rather than per record
+        ids, _, documents, metadatas = _unpack(preview)
+        n = len(ids)
+        for id_, doc, meta in zip_longest(ids, documents[:n], metadatas[:n]):
+            append(f"  ID: {id_[:20]}...")
+            if doc:
+                append(f"    Document: {_truncate(doc, 50)}")
+            if meta:
+                append(f"    Metadata keys: {list(meta.keys())}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def collection_info(collection_name: str) -> dict:
+    """Get information about a collection.
     
+    Args:
+        collection_name: Name of the collection
+        
+    Returns:
+        Dictionary with collection info: name, count, preview
+    """
+    info = _fetch_collection_info(collection_name)
+    _print_collection_info(info)
     return info
 
 
+def all_collections_info() -> list[dict]:
+    """Get information about every collection.
+
+    Collections are fetched one after another: the client holds a single
+    connection, which is not shared between threads.
+
+    Returns:
+        List of collection info dictionaries, in list_collections() order
+    """
+    collections = _client().list_collections()
+    if not collections:
+        print("No collections found.")
+        return []
+
+    infos = []
+    for col in collections:
+        info = _fetch_collection_info(col.name if hasattr(col, 'name') else str(col))
+        _print_collection_info(info)
+        infos.append(info)
+
+    return infos
+
+
+def _write_json(results: Any) -> None:
+    """Write results to stdout as indented JSON, using orjson when available."""
+    if orjson is not None:
+        data = orjson.dumps(
+            results,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+        sys.stdout.flush()
+        sys.stdout.buffer.write(data + b"\n")
+        sys.stdout.buffer.flush()
+    else:
+        print(json.dumps(results, indent=2, default=str))
+
+
 def output_results(results: dict, output_path: Optional[str],
-                   as_json: bool, sheet_name: str = "Data"):
+                   as_json: bool, sheet_name: str = "Data", bom: bool = True):
     """
     Output results to terminal, JSON, or file.
 
@@ -373,22 +920,59 @@ def output_results(results: dict, output_path: Optional[str],
         output_path: Optional file path for export (.csv or .xlsx)
         as_json: Output as JSON to terminal
         sheet_name: Sheet name for Excel export
+        bom: Write a UTF-8 BOM at the start of CSV exports
     """
     if output_path:
-        # Export to file
-        df = results_to_dataframe(results)
-        if df.empty:
+        # Bail out on empty results before touching polars/pandas
+        ids = _unpack(results)[0]
+        if not ids:
             print("No results found to export.")
             return
 
-        abs_path = export_to_file(df, output_path, sheet_name=sheet_name)
-        print(f"Exported {len(df)} records to: {abs_path}")
+        path = Path(output_path)
+        suffix = path.suffix.lower()
+        # Create parent directories if they don't exist
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        if suffix == '.csv':
+            # CSV export streams results directly, no pandas round-trip
+            _write_csv_streaming(results, output_path, bom=bom)
+            abs_path = str(path.absolute())
+        elif suffix in ['.xlsx', '.xls'] and _export_with_polars(
+                results, output_path, sheet_name=sheet_name):
+            abs_path = str(path.absolute())
+        else:
+            # Excel without polars (or unsupported suffix) goes through pandas
+            df = results_to_dataframe(results)
+            abs_path = export_to_file(
+                df, output_path, sheet_name=sheet_name, bom=bom)
+
+        print(f"Exported {len(ids)} records to: {abs_path}")
     elif as_json:
-        print(json.dumps(results, indent=2, default=str))
+        _write_json(results)
     else:
         print_results(results)
 
 
+def export_pages_to_csv(pages: Iterable[dict], output_path: str, bom: bool = True):
+    """
+    Export result pages (e.g. from iter_by_filter) to a CSV file.
+
+    Args:
+        pages: Iterable of results dictionaries
+        output_path: Output file path (.csv)
+        bom: Write a UTF-8 BOM at the start of the file
+    """
+    path = Path(output_path)
+    # Create parent directories if they don't exist
+    path.parent.mkdir(parents=True, exist_ok=True)
+    n = _write_csv_pages(pages, output_path, bom=bom)
+    if not n:
+        print("No results found to export.")
+        return
+    print(f"Exported {n} records to: {path.absolute()}")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Query data from seekdb vector database and optionally export to CSV/Excel",
@@ -401,18 +985,25 @@ def main():
                         help="Name of the collection to query")
 
     # Query modes
-    parser.add_argument("--query-text", "-q",
-                        help="Text query for semantic similarity search")
+    parser.add_argument("--query-text", "-q", action="append",
+                        help="Text query for semantic similarity search; repeat to run several queries")
     parser.add_argument("--list-collections", "-l", action="store_true",
                         help="List all available collections")
     parser.add_argument("--info", action="store_true",
                         help="Show collection info and preview")
+    parser.add_argument("--info-all", action="store_true",
+                        help="Show info and preview for every collection")
 
     # Common options
-    parser.add_argument("--n-results", "-n", type=int, default=5,
-                        help="Number of results to return (default: 5)")
+    parser.add_argument("--n-results", "-n", type=int,
+                        help="Number of results to return (default: 5 for hybrid search, "
+                             "all matches for scalar search)")
+    parser.add_argument("--offset", type=int, default=0,
+                        help="Number of results to skip in scalar search, for pagination (default: 0)")
     parser.add_argument("--where", "-w",
                         help="Metadata filter as JSON string, e.g., '{\"Brand\": {\"$eq\": \"SAMSUNG\"}}'")
+    parser.add_argument("--rrf-k", type=int, default=60,
+                        help="RRF rank constant k for hybrid search ranking (default: 60)")
     parser.add_argument("--include",
                         help="Comma-separated fields to include: documents,metadatas,embeddings")
     parser.add_argument("--json", "-j", action="store_true",
@@ -423,6 +1014,8 @@ def main():
                         help="Export results to file (.csv or .xlsx)")
     parser.add_argument("--sheet-name", "-s", default="Data",
                         help="Sheet name for Excel export (default: Data)")
+    parser.add_argument("--no-bom", action="store_true",
+                        help="Write CSV exports as plain UTF-8 without a BOM")
 
     args = parser.parse_args()
 
@@ -431,16 +1024,25 @@ def main():
         list_collections()
         return
 
+    # Handle info-all (no collection_name required)
+    if args.info_all:
+        try:
+            all_collections_info()
+        except Exception as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        return
+
     # All other modes require collection_name (except --list-collections)
     if not args.collection_name:
         parser.error(
-            "collection_name is required (except for --list-collections)")
+            "collection_name is required (except for --list-collections and --info-all)")
 
     # Parse where filter
     where_filter = None
     if args.where:
         try:
-            where_filter = json.loads(args.where)
+            where_filter = _json_loads(args.where)
         except json.JSONDecodeError as e:
             print(f"Error: Invalid JSON in --where: {e}", file=sys.stderr)
             sys.exit(1)
@@ -450,28 +1052,67 @@ def main():
     if args.include:
         include_list = [f.strip() for f in args.include.split(",")]
 
+    # Hybrid search always ranks a bounded top-n; scalar search returns
+    # every match unless a limit is asked for
+    hybrid_n_results = args.n_results if args.n_results is not None else 5
+
+    # Each --query-text is one search, used verbatim
+    query_texts = args.query_text or []
+    if any(not text.strip() for text in query_texts):
+        parser.error("--query-text is empty")
+    if len(query_texts) > 1 and args.output:
+        parser.error("--output supports a single --query-text")
+
     try:
         if args.info:
             collection_info(args.collection_name)
-        elif args.query_text:
+        elif len(query_texts) > 1:
+            # Several hybrid searches, reported one section per query
+            all_results = hybrid_search_many(
+                args.collection_name,
+                query_texts,
+                n_results=hybrid_n_results,
+                where=where_filter,
+                include=include_list,
+                rrf_k=args.rrf_k
+            )
+            if args.json:
+                _write_json([{"query": text, "results": results}
+                             for text, results in zip(query_texts, all_results)])
+            else:
+                for text, results in zip(query_texts, all_results):
+                    print(f"\nQuery: {text}")
+                    print_results(results)
+        elif query_texts:
             # Hybrid search: fulltext + semantic (with optional scalar filter)
             # query_text is used for BOTH fulltext ($contains) and semantic (query_texts)
             results = hybrid_search(
                 collection_name=args.collection_name,
-                query_text=args.query_text,
-                n_results=args.n_results,
+                query_text=query_texts[0],
+                n_results=hybrid_n_results,
                 where=where_filter,
-                include=include_list
+                include=include_list,
+                rrf_k=args.rrf_k
             )
-            output_results(results, args.output, args.json, args.sheet_name)
+            output_results(results, args.output, args.json,
+                           args.sheet_name, bom=not args.no_bom)
         elif where_filter:
             # Pure scalar search (no semantic search)
-            results = get_by_filter(
+            scalar_params = dict(
                 collection_name=args.collection_name,
                 where=where_filter,
-                include=include_list
+                include=include_list,
+                n_results=args.n_results,
+                offset=args.offset
             )
-            output_results(results, args.output, args.json, args.sheet_name)
+            if args.output and Path(args.output).suffix.lower() == '.csv':
+                # Write each fetched page out instead of merging them first
+                export_pages_to_csv(iter_by_filter(**scalar_params), args.output,
+                                    bom=not args.no_bom)
+            else:
+                results = get_by_filter(**scalar_params)
+                output_results(results, args.output, args.json,
+                               args.sheet_name, bom=not args.no_bom)
         else:
             # Default: show collection info
             collection_info(args.collection_name)
@@ -22,6 +22,12 @@ Usage:
     # Adjust concurrency and rate limiting
     python generate_catalog.py --concurrency 10 --max-chars 12000
 
+    # Pace requests to the provider's per-minute limits
+    python generate_catalog.py --concurrency 50 --rpm 500 --tpm 200000
+
+    # Describe 8 documents per request to cut per-request overhead
+    python generate_catalog.py --batch-size 8
+
 Environment Variables:
     OPENAI_API_KEY      API key for the OpenAI-compatible service (required)
     OPENAI_BASE_URL     Base URL override (alternative to --base-url)
@@ -33,9 +39,19 @@ import hashlib
 import json
 import logging
 import os
+import re
 import sys
 import time
 from pathlib import Path
+from typing import Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson parses bytes/str directly and its errors subclass ValueError
+_json_loads = orjson.loads if orjson is not None else json.loads
 
 # ---------------------------------------------------------------------------
 # Resolve paths relative to this script
@@ -48,6 +64,9 @@ CATALOG_FILE = REFERENCES_DIR / "seekdb-docs-catalog.jsonl"
 BRANCH_MAP_FILE = REFERENCES_DIR / "_branch_map.tsv"
 HASH_CACHE_FILE = REFERENCES_DIR / "_catalog_hash_cache.json"
 
+# Max concurrent file reads/hashes dispatched to worker threads
+IO_CONCURRENCY = 32
+
 # ---------------------------------------------------------------------------
 # Prompt template
 # ---------------------------------------------------------------------------
@@ -77,6 +96,25 @@ Content (may be truncated):
 
 Description:"""
 
+BATCH_SYSTEM_PROMPT = SYSTEM_PROMPT + """- You will receive several pages at once. Reply with a JSON object that maps \
+each file path exactly as given to its description, and nothing else.
+"""
+
+BATCH_USER_PROMPT_TEMPLATE = """Write a search-oriented description for each of the following seekdb \
+documentation pages.
+
+{documents}
+Return a JSON object of the form {{"<file path>": "<description>", ...}}."""
+
+BATCH_DOCUMENT_TEMPLATE = """File path: {path}
+
+Content (may be truncated):
+---
+{content}
+---
+
+"""
+
 # ---------------------------------------------------------------------------
 # Logging
 # ---------------------------------------------------------------------------
@@ -87,7 +125,7 @@ logging.basicConfig(
 )
 log = logging.getLogger("generate_catalog")
 
-# Suppress noisy HTTP request logs from openai/httpx
+# Suppress noisy HTTP request logs from openai/httpx (SDK fallback)
 logging.getLogger("httpx").setLevel(logging.WARNING)
 logging.getLogger("openai").setLevel(logging.WARNING)
 
@@ -97,13 +135,22 @@ logging.getLogger("openai").setLevel(logging.WARNING)
 # ---------------------------------------------------------------------------
 def file_md5(filepath: Path) -> str:
     """Return the MD5 hex digest of a file."""
-    h = hashlib.md5()
     with open(filepath, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "md5").hexdigest()
+        h = hashlib.md5()
+        buf = memoryview(bytearray(1 << 20))
+        while n := f.readinto(buf):
+            h.update(buf[:n])
     return h.hexdigest()
 
 
+def file_sig(filepath: Path) -> str:
+    """Return a cheap change signature for a file from a single stat call."""
+    st = filepath.stat()
+    return f"{st.st_size}:{st.st_mtime_ns}"
+
+
 def load_branch_map(path: Path) -> dict[str, str]:
     """Load _branch_map.tsv into a dict: relative_path -> branch."""
     mapping = {}
@@ -122,45 +169,115 @@ def load_branch_map(path: Path) -> dict[str, str]:
     return mapping
 
 
-def load_hash_cache(path: Path) -> dict[str, str]:
-    """Load the hash cache (path -> md5) from disk."""
+def load_hash_cache(path: Path) -> dict[str, dict]:
+    """Load the hash cache (path -> {"sig", "md5"}) from disk.
+
+    Older caches stored a bare MD5 string per path; those are upgraded
+    in memory so the first run re-verifies them by content.
+    """
     if not path.exists():
         return {}
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError):
+        with open(path, "rb") as f:
+            raw = _json_loads(f.read())
+    except (ValueError, OSError):
         return {}
+    return {
+        k: {"md5": v} if isinstance(v, str) else v
+        for k, v in raw.items()
+    }
 
 
-def save_hash_cache(path: Path, cache: dict[str, str]) -> None:
+def save_hash_cache(path: Path, cache: dict[str, dict]) -> None:
     """Persist the hash cache to disk."""
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(cache, f, indent=2)
+    if orjson is not None:
+        data = orjson.dumps(cache, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(cache, indent=2).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(data)
+
 
+def load_existing_catalog(
+    path: Path, raw_lines: Optional[dict[str, bytes]] = None
+) -> dict[str, dict]:
+    """Load existing catalog as a dict keyed by path.
 
-def load_existing_catalog(path: Path) -> dict[str, dict]:
-    """Load existing catalog as a dict keyed by path."""
+    If ``raw_lines`` is given, it is filled with path -> original JSONL line
+    so unchanged entries can be written back without re-serializing.
+    """
     entries = {}
     if not path.exists():
         return entries
-    with open(path, "r", encoding="utf-8") as f:
+    with open(path, "rb") as f:
         for line in f:
             line = line.strip()
             if not line:
                 continue
             try:
-                entry = json.loads(line)
+                entry = _json_loads(line)
                 entries[entry["path"]] = entry
-            except (json.JSONDecodeError, KeyError):
+                if raw_lines is not None:
+                    raw_lines[entry["path"]] = line
+            except (ValueError, KeyError):
                 continue
     return entries
 
 
-def collect_md_files(docs_dir: Path) -> list[Path]:
-    """Collect all .md files under docs_dir, sorted by relative path."""
-    files = sorted(docs_dir.rglob("*.md"))
-    return files
+def partial_path_for(output_path: Path) -> Path:
+    """Return the progress file that records entries as they complete."""
+    return output_path.with_name(output_path.name + ".partial")
+
+
+def load_partial_catalog(path: Path) -> dict[str, tuple[dict, dict]]:
+    """Load entries saved by an interrupted run: path -> (entry, hash record)."""
+    records = {}
+    if not path.exists():
+        return records
+    with open(path, "rb") as f:
+        for line in f:
+            try:
+                record = _json_loads(line)
+                entry, file_hash = record["entry"], record["hash"]
+            except (ValueError, KeyError, TypeError):
+                # Typically the last line, cut short by the interruption
+                continue
+            if entry.get("description"):
+                records[entry["path"]] = (entry, file_hash)
+    return records
+
+
+def collect_md_files(docs_dir: Path) -> list[tuple[Path, str]]:
+    """Collect all .md files under docs_dir as (path, relative path) pairs.
+
+    Relative paths use forward slashes and the list is sorted by them.
+    """
+    # os.scandir exposes the entry type from the directory listing itself,
+    # avoiding the per-entry stat() and Path construction of rglob()
+    files = []
+    stack = [str(docs_dir)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".md") and entry.is_file():
+                    files.append(entry.path)
+    # Every path starts with docs_dir + separator, so slicing is enough
+    prefix_len = len(os.path.join(str(docs_dir), ""))
+    pairs = [(f[prefix_len:].replace(os.sep, "/"), f) for f in files]
+    pairs.sort()
+    return [(Path(f), rel) for rel, f in pairs]
+
+
+def read_head(filepath: Path, max_chars: int) -> str:
+    """Read at most max_chars + 1 characters from the start of a file.
+
+    The extra character lets truncate_content() tell that the document
+    was cut without loading the rest of it.
+    """
+    with open(filepath, "r", encoding="utf-8", errors="replace") as f:
+        return f.read(max_chars + 1)
 
 
 def truncate_content(content: str, max_chars: int) -> str:
@@ -171,32 +288,234 @@ def truncate_content(content: str, max_chars: int) -> str:
 
 
 # ---------------------------------------------------------------------------
-# LLM client (async, using openai SDK with semaphore for concurrency)
+# Rate limiting (token buckets for requests/minute and tokens/minute)
 # ---------------------------------------------------------------------------
-class LLMClient:
-    """Async OpenAI-compatible chat completions client using the openai SDK."""
+_RESET_PART_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_RESET_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
 
-    def __init__(self, base_url: str, api_key: str, model: str, concurrency: int):
+def parse_reset_duration(value: str) -> float:
+    """Parse an x-ratelimit-reset-* header value (e.g. "6m0s", "20ms") into seconds."""
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    return sum(
+        float(num) * _RESET_UNITS[unit]
+        for num, unit in _RESET_PART_RE.findall(value)
+    )
+
+
+class RateLimiter:
+    """Dual token-bucket limiter for a provider's RPM and TPM budgets.
+
+    Both buckets refill continuously at their per-minute rate. A budget of 0
+    disables that bucket. Response headers can tighten the buckets (or pause
+    them until the provider's reset time) when the server reports less
+    headroom than the local estimate.
+    """
+
+    def __init__(self, rpm: int = 0, tpm: int = 0):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = float(rpm)
+        self._tokens = float(tpm)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        if self.rpm:
+            self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60)
+        if self.tpm:
+            self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60)
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until one request and ``tokens`` tokens fit in the budget."""
+        if self.tpm:
+            tokens = min(tokens, self.tpm)
+        # Check-and-take runs without an await in between, so it is atomic on
+        # the event loop; each waiter sleeps on its own instead of holding a
+        # lock that would stall requests the buckets could already admit
+        while True:
+            now = time.monotonic()
+            self._refill(now)
+            wait = self._paused_until - now
+            if self.rpm and self._requests < 1:
+                wait = max(wait, (1 - self._requests) * 60 / self.rpm)
+            if self.tpm and self._tokens < tokens:
+                wait = max(wait, (tokens - self._tokens) * 60 / self.tpm)
+            if wait <= 0:
+                break
+            await asyncio.sleep(wait)
+        if self.rpm:
+            self._requests -= 1
+        if self.tpm:
+            self._tokens -= tokens
+
+    def refund(self, tokens: int) -> None:
+        """Settle a request's token estimate once the actual usage is known.
+
+        A positive ``tokens`` returns an over-estimate to the bucket; a
+        negative one takes the overage, so the bucket can go below zero and
+        later requests wait until it has refilled.
+        """
+        if self.tpm:
+            self._tokens = min(self.tpm, self._tokens + tokens)
+
+    def update_from_headers(self, headers) -> None:
+        """Sync the buckets with x-ratelimit-* response headers, if present."""
+        now = time.monotonic()
+        for kind in ("requests", "tokens"):
+            remaining = headers.get(f"x-ratelimit-remaining-{kind}")
+            if remaining is None:
+                continue
+            try:
+                remaining = float(remaining)
+            except ValueError:
+                continue
+            if kind == "requests" and self.rpm:
+                self._requests = min(self._requests, remaining)
+            elif kind == "tokens" and self.tpm:
+                self._tokens = min(self._tokens, remaining)
+            if remaining <= 0:
+                reset = headers.get(f"x-ratelimit-reset-{kind}")
+                if reset:
+                    self._paused_until = max(
+                        self._paused_until, now + parse_reset_duration(reset)
+                    )
+
+
+# ---------------------------------------------------------------------------
+# LLM client (async; pooled aiohttp session, or the openai SDK as fallback)
+# ---------------------------------------------------------------------------
+# HTTP statuses worth retrying: rate limit and transient server errors
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 3
+
+
+class LLMClient:
+    """Async OpenAI-compatible chat completions client.
+
+    Requests go straight to ``{base_url}/chat/completions`` over a pooled
+    aiohttp session when aiohttp is installed, skipping the SDK's per-call
+    model validation. Otherwise the openai SDK is used.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        model: str,
+        concurrency: int,
+        rpm: int = 0,
+        tpm: int = 0,
+    ):
         self._base_url = base_url
         self._api_key = api_key
         self.model = model
+        self.concurrency = concurrency
         self.semaphore = asyncio.Semaphore(concurrency)
+        self.limiter = RateLimiter(rpm=rpm, tpm=tpm)
+        self._session = None  # aiohttp.ClientSession
         self._client = None  # Lazy init — avoids importing openai in dry-run
 
     def _ensure_client(self):
-        """Lazily create the AsyncOpenAI client on first real API call."""
-        if self._client is None:
-            try:
-                from openai import AsyncOpenAI
-            except ImportError:
-                log.error("openai package is required. Install it with: pip install openai")
-                sys.exit(1)
-            self._client = AsyncOpenAI(
-                api_key=self._api_key,
-                base_url=self._base_url,
-                timeout=60.0,
-                max_retries=3,
+        """Lazily create the HTTP session (or AsyncOpenAI client) on first real API call."""
+        if self._session is not None or self._client is not None:
+            return
+        try:
+            import aiohttp
+        except ImportError:
+            aiohttp = None
+        if aiohttp is not None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.concurrency, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=60),
+                headers={"Authorization": f"Bearer {self._api_key}"},
             )
+            self._url = self._base_url.rstrip("/") + "/chat/completions"
+            return
+        try:
+            from openai import AsyncOpenAI
+        except ImportError:
+            log.error("aiohttp or openai package is required. Install it with: pip install aiohttp")
+            sys.exit(1)
+        self._client = AsyncOpenAI(
+            api_key=self._api_key,
+            base_url=self._base_url,
+            timeout=60.0,
+            max_retries=MAX_RETRIES,
+        )
+
+    async def _post(self, body: dict) -> tuple[str, Optional[int]]:
+        """POST a chat completion, retrying 429/5xx with exponential backoff.
+
+        Returns:
+            (message content, total tokens used or None)
+        """
+        import aiohttp
+
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                async with self._session.post(self._url, json=body) as resp:
+                    self.limiter.update_from_headers(resp.headers)
+                    if resp.status in RETRY_STATUSES and attempt < MAX_RETRIES:
+                        retry_after = resp.headers.get("retry-after")
+                        delay = float(retry_after) if retry_after and retry_after.isdigit() else 2 ** attempt
+                        log.debug("HTTP %d, retrying in %.1fs", resp.status, delay)
+                        await asyncio.sleep(delay)
+                        continue
+                    if resp.status >= 400:
+                        raise RuntimeError(f"HTTP {resp.status}: {(await resp.text())[:200]}")
+                    data = _json_loads(await resp.read())
+                    break
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if attempt == MAX_RETRIES:
+                    raise
+                await asyncio.sleep(2 ** attempt)
+        usage = data.get("usage") or {}
+        return data["choices"][0]["message"]["content"], usage.get("total_tokens")
+
+    async def _complete(
+        self, system_prompt: str, user_prompt: str, max_tokens: int, **kwargs
+    ) -> str:
+        """Send one chat completion under the concurrency and rate limits."""
+        # Rough token estimate (~4 chars/token) plus the completion budget
+        estimated = (len(system_prompt) + len(user_prompt)) // 4 + max_tokens
+        body = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            "temperature": 0.3,
+            "max_tokens": max_tokens,
+            **kwargs,
+        }
+
+        async with self.semaphore:
+            self._ensure_client()
+            await self.limiter.acquire(estimated)
+            if self._session is not None:
+                content, used = await self._post(body)
+            else:
+                raw = await self._client.chat.completions.with_raw_response.create(**body)
+                self.limiter.update_from_headers(raw.headers)
+                response = raw.parse()
+                content = response.choices[0].message.content
+                used = response.usage.total_tokens if response.usage else None
+            if used is not None:
+                self.limiter.refund(estimated - used)
+            return content.strip()
+
+    @staticmethod
+    def _clean(description: str) -> str:
+        """Remove surrounding quotes if present."""
+        if description.startswith('"') and description.endswith('"'):
+            description = description[1:-1]
+        return description
 
     async def generate_description(
         self, path: str, content: str, max_chars: int
@@ -204,29 +523,56 @@ class LLMClient:
         """Call the LLM to generate a description for a document."""
         truncated = truncate_content(content, max_chars)
         user_prompt = USER_PROMPT_TEMPLATE.format(path=path, content=truncated)
-
-        async with self.semaphore:
-            self._ensure_client()
-            try:
-                response = await self._client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {"role": "system", "content": SYSTEM_PROMPT},
-                        {"role": "user", "content": user_prompt},
-                    ],
-                    temperature=0.3,
-                    max_tokens=256,
-                )
-                description = response.choices[0].message.content.strip()
-                # Remove surrounding quotes if present
-                if description.startswith('"') and description.endswith('"'):
-                    description = description[1:-1]
-                return description
-            except Exception as e:
-                log.error("Failed to generate description for %s: %s", path, e)
-                return ""
+        try:
+            description = await self._complete(SYSTEM_PROMPT, user_prompt, 256)
+            return self._clean(description)
+        except Exception as e:
+            log.error("Failed to generate description for %s: %s", path, e)
+            return ""
+
+    async def generate_descriptions_batch(
+        self, items: list[tuple[str, str]], max_chars: int
+    ) -> dict[str, str]:
+        """Generate descriptions for several documents in one request.
+
+        Args:
+            items: (path, content) pairs.
+            max_chars: Per-document content limit.
+
+        Returns:
+            Mapping of path -> description for the documents the model
+            answered; missing or malformed entries are left out.
+        """
+        documents = "".join(
+            BATCH_DOCUMENT_TEMPLATE.format(
+                path=path, content=truncate_content(content, max_chars)
+            )
+            for path, content in items
+        )
+        user_prompt = BATCH_USER_PROMPT_TEMPLATE.format(documents=documents)
+        try:
+            reply = await self._complete(
+                BATCH_SYSTEM_PROMPT,
+                user_prompt,
+                256 * len(items),
+                response_format={"type": "json_object"},
+            )
+            data = _json_loads(reply)
+        except Exception as e:
+            log.warning("Batch request for %d documents failed: %s", len(items), e)
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        wanted = {path for path, _ in items}
+        return {
+            path: self._clean(desc.strip())
+            for path, desc in data.items()
+            if path in wanted and isinstance(desc, str) and desc.strip()
+        }
 
     async def close(self):
+        if self._session is not None:
+            await self._session.close()
         if self._client is not None:
             await self._client.close()
 
@@ -235,106 +581,222 @@ class LLMClient:
 # Main logic
 # ---------------------------------------------------------------------------
 async def process_files(
-    files: list[Path],
-    docs_dir: Path,
+    files: list[tuple[Path, str]],
     llm: LLMClient,
     max_chars: int,
     existing_catalog: dict[str, dict],
-    hash_cache: dict[str, str],
+    hash_cache: dict[str, dict],
     incremental: bool,
     dry_run: bool,
     branch_map: dict[str, str],
+    batch_size: int = 1,
+    partial_path: Optional[Path] = None,
+    resumed: frozenset[str] = frozenset(),
 ) -> list[dict]:
-    """Process all files and return catalog entries."""
-    entries = []
-    tasks = []
+    """Process all files and return catalog entries.
+
+    Each generated entry is appended to ``partial_path`` as soon as it
+    completes, so an interrupted run can be resumed. Paths in ``resumed``
+    were recovered from such a file and are reused if still unchanged,
+    even outside incremental mode.
+    """
+    # Entries keyed by path; emitted in the (already sorted) file order
+    entries: dict[str, dict] = {}
     skipped = 0
 
-    for filepath in files:
-        rel_path = str(filepath.relative_to(docs_dir))
-        current_hash = file_md5(filepath)
+    io_semaphore = asyncio.Semaphore(IO_CONCURRENCY)
+
+    async def _fingerprint(filepath: Path, rel_path: str) -> dict:
+        # (size, mtime_ns) decides whether content may have changed; only
+        # then is the file hashed (on a worker thread) to confirm it.
+        sig = file_sig(filepath)
+        cached = hash_cache.get(rel_path)
+        if cached and cached.get("sig") == sig:
+            return cached
+        async with io_semaphore:
+            md5 = await asyncio.to_thread(file_md5, filepath)
+        return {"sig": sig, "md5": md5}
+
+    def _reuse(rel_path: str, current_hash: dict) -> bool:
+        # In incremental mode (or when resuming), skip files whose content
+        # hasn't changed and whose description already exists
+        reusable = incremental or rel_path in resumed
+        if not (reusable and rel_path in hash_cache and rel_path in existing_catalog):
+            return False
+        if hash_cache[rel_path].get("md5") != current_hash["md5"]:
+            return False
+        # Refresh the stored signature (e.g. after a fresh checkout)
+        hash_cache[rel_path] = current_hash
+        # Reuse existing entry as-is; copy only if the branch changed
+        entry = existing_catalog[rel_path]
+        branch = branch_map.get(rel_path)
+        if branch is not None and entry.get("branch") != branch:
+            entry = {**entry, "branch": branch}
+        entries[rel_path] = entry
+        return True
+
+    rel_paths = [rp for _, rp in files]
 
-        # In incremental mode, skip files whose hash hasn't changed
-        # and whose description already exists
-        if incremental and rel_path in hash_cache and rel_path in existing_catalog:
-            if hash_cache[rel_path] == current_hash:
-                # Reuse existing entry, update branch if needed
-                entry = existing_catalog[rel_path].copy()
-                if rel_path in branch_map:
-                    entry["branch"] = branch_map[rel_path]
-                entries.append(entry)
+    if dry_run:
+        fingerprints = await asyncio.gather(*[_fingerprint(fp, rp) for fp, rp in files])
+        for rel_path, current_hash in zip(rel_paths, fingerprints):
+            if _reuse(rel_path, current_hash):
                 skipped += 1
                 continue
-
-        if dry_run:
             log.info("[DRY RUN] Would process: %s", rel_path)
-            entries.append({
+            entries[rel_path] = {
                 "path": rel_path,
                 "description": "(dry run - not generated)",
                 **({"branch": branch_map[rel_path]} if rel_path in branch_map else {}),
-            })
-            continue
-
-        # Read content
-        content = filepath.read_text(encoding="utf-8", errors="replace")
-
-        # Schedule async task
-        tasks.append((rel_path, current_hash, content))
-
-    if incremental and skipped > 0:
-        log.info("Incremental mode: skipped %d unchanged files", skipped)
-
-    if dry_run:
+            }
+        if incremental and skipped > 0:
+            log.info("Incremental mode: skipped %d unchanged files", skipped)
         log.info("[DRY RUN] Would process %d files total", len(files) - skipped)
-        return entries
+        return [entries[rp] for rp in rel_paths]
+
+    # Files are queued as soon as their fingerprint is known, so the first
+    # LLM requests start while the rest are still being hashed. A fixed pool
+    # of workers pulls from the queue, so at most `concurrency` batches of
+    # documents are held in memory at any time. None marks the end.
+    pending: asyncio.Queue = asyncio.Queue()
+    done: asyncio.Queue = asyncio.Queue()
+    n_workers = max(1, min(llm.concurrency, len(files)))
+    queued = 0
+    feeding = True
+
+    async def _feed():
+        nonlocal feeding
+
+        async def _classify(filepath: Path, rel_path: str):
+            nonlocal skipped, queued
+            current_hash = await _fingerprint(filepath, rel_path)
+            if _reuse(rel_path, current_hash):
+                skipped += 1
+            else:
+                queued += 1
+                pending.put_nowait((rel_path, current_hash, filepath))
+
+        try:
+            await asyncio.gather(*[_classify(fp, rp) for fp, rp in files])
+        finally:
+            feeding = False
+            for _ in range(n_workers):
+                pending.put_nowait(None)
+        if incremental and skipped > 0:
+            log.info("Incremental mode: skipped %d unchanged files", skipped)
+        if queued:
+            log.info("Generating descriptions for %d files...", queued)
+
+    async def _describe(items: list[tuple[str, str]]) -> dict[str, str]:
+        if len(items) == 1:
+            path, content = items[0]
+            return {path: await llm.generate_description(path, content, max_chars)}
+        descriptions = await llm.generate_descriptions_batch(items, max_chars)
+        # Fall back to one request per document the batch didn't cover
+        missing = [(p, c) for p, c in items if p not in descriptions]
+        if missing:
+            log.debug("Batch missed %d of %d documents; retrying individually",
+                      len(missing), len(items))
+            retried = await asyncio.gather(
+                *[llm.generate_description(p, c, max_chars) for p, c in missing]
+            )
+            descriptions.update(zip((p for p, _ in missing), retried))
+        return descriptions
+
+    async def _worker():
+        while True:
+            item = await pending.get()
+            if item is None:
+                return
+            # Wait for a full batch while files are still being hashed; only
+            # the last batch of each worker can be short
+            batch = [item]
+            while len(batch) < batch_size:
+                item = await pending.get()
+                if item is None:
+                    # Leave the end marker for the next get() of this worker
+                    pending.put_nowait(None)
+                    break
+                batch.append(item)
+            items = []
+            for rel_path, _, filepath in batch:
+                async with io_semaphore:
+                    content = await asyncio.to_thread(read_head, filepath, max_chars)
+                items.append((rel_path, content))
+            descriptions = await _describe(items)
+            for rel_path, current_hash, _ in batch:
+                entry = {"path": rel_path, "description": descriptions[rel_path]}
+                if rel_path in branch_map:
+                    entry["branch"] = branch_map[rel_path]
+                await done.put((rel_path, current_hash, entry))
 
-    # Process files concurrently with progress reporting
-    if tasks:
-        total = len(tasks)
-        log.info("Generating descriptions for %d files...", total)
+    async def _workers():
+        try:
+            await asyncio.gather(*[_worker() for _ in range(n_workers)])
+        finally:
+            done.put_nowait(None)
 
+    async def _writer():
+        progress = None
         completed = 0
-        progress_lock = asyncio.Lock()
-
-        async def _process_one(rel_path: str, current_hash: str, content: str):
-            nonlocal completed
-            description = await llm.generate_description(
-                rel_path, content, max_chars
-            )
-            entry = {"path": rel_path, "description": description}
-            if rel_path in branch_map:
-                entry["branch"] = branch_map[rel_path]
-
-            async with progress_lock:
+        try:
+            while (item := await done.get()) is not None:
+                rel_path, current_hash, entry = item
+                entries[rel_path] = entry
+                hash_cache[rel_path] = current_hash
+                if partial_path is not None:
+                    if progress is None:
+                        progress = open(partial_path, "ab")
+                    progress.write(_dumps_entry({"entry": entry, "hash": current_hash}))
+                    progress.write(b"\n")
+                    progress.flush()
                 completed += 1
-                if completed % 10 == 0 or completed == total:
-                    log.info("Progress: %d/%d (%.0f%%)", completed, total, completed / total * 100)
-
-            return rel_path, current_hash, entry
-
-        results = await asyncio.gather(
-            *[_process_one(rp, h, c) for rp, h, c in tasks]
-        )
-
-        new_hash_cache = dict(hash_cache)
-        for rel_path, current_hash, entry in results:
-            entries.append(entry)
-            new_hash_cache[rel_path] = current_hash
-
-        # Update hash cache
-        hash_cache.update(new_hash_cache)
-
-    # Sort entries by path for stable output
-    entries.sort(key=lambda e: e["path"])
-    return entries
-
-
-def write_catalog(entries: list[dict], output_path: Path) -> None:
-    """Write catalog entries to JSONL file."""
+                if feeding:
+                    if completed % 10 == 0:
+                        log.info("Progress: %d (still scanning files)", completed)
+                elif completed % 10 == 0 or completed == queued:
+                    log.info("Progress: %d/%d (%.0f%%)", completed, queued, completed / queued * 100)
+        finally:
+            if progress is not None:
+                progress.close()
+
+    await asyncio.gather(_feed(), _workers(), _writer())
+
+    # `files` is sorted by relative path, so this is already stable output
+    return [entries[rp] for rp in rel_paths]
+
+
+def _dumps_entry(entry: dict) -> bytes:
+    """Serialize a catalog entry as compact UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(entry)
+    return json.dumps(entry, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def write_catalog(
+    entries: list[dict],
+    output_path: Path,
+    existing_catalog: Optional[dict[str, dict]] = None,
+    raw_lines: Optional[dict[str, bytes]] = None,
+) -> None:
+    """Write catalog entries to JSONL file.
+
+    Entries that are the very objects loaded from ``existing_catalog`` are
+    written from their original line in ``raw_lines`` instead of being
+    serialized again.
+    """
+    existing_catalog = existing_catalog or {}
+    raw_lines = raw_lines or {}
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
+    with open(output_path, "wb", buffering=1 << 20) as f:
         for entry in entries:
-            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            path = entry["path"]
+            raw = raw_lines.get(path)
+            if raw is not None and existing_catalog.get(path) is entry:
+                f.write(raw)
+            else:
+                f.write(_dumps_entry(entry))
+            f.write(b"\n")
     log.info("Wrote %d entries to %s", len(entries), output_path)
 
 
@@ -381,6 +843,24 @@ async def main():
         default=5,
         help="Max concurrent API requests (default: 5)",
     )
+    parser.add_argument(
+        "--rpm",
+        type=int,
+        default=0,
+        help="Provider requests-per-minute budget (default: 0 = unlimited)",
+    )
+    parser.add_argument(
+        "--tpm",
+        type=int,
+        default=0,
+        help="Provider tokens-per-minute budget (default: 0 = unlimited)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1,
+        help="Documents described per API request (default: 1)",
+    )
     parser.add_argument(
         "--max-chars",
         type=int,
@@ -426,18 +906,32 @@ async def main():
 
     # Load auxiliary data
     branch_map = load_branch_map(args.branch_map)
-    existing_catalog = load_existing_catalog(args.output)
+    raw_lines: dict[str, bytes] = {}
+    existing_catalog = load_existing_catalog(args.output, raw_lines)
     hash_cache = load_hash_cache(HASH_CACHE_FILE)
 
     if existing_catalog:
         log.info("Loaded existing catalog: %d entries", len(existing_catalog))
 
+    # Pick up entries written by an interrupted run
+    partial_path = partial_path_for(args.output)
+    resumed = {} if args.dry_run else load_partial_catalog(partial_path)
+    if resumed:
+        log.info("Resuming interrupted run: %d entries recovered from %s",
+                 len(resumed), partial_path)
+        for rel_path, (entry, file_hash) in resumed.items():
+            existing_catalog[rel_path] = entry
+            hash_cache[rel_path] = file_hash
+            raw_lines.pop(rel_path, None)
+
     # Create LLM client
     llm = LLMClient(
         base_url=args.base_url,
         api_key=args.api_key,
         model=args.model,
         concurrency=args.concurrency,
+        rpm=args.rpm,
+        tpm=args.tpm,
     )
 
     start_time = time.time()
@@ -445,7 +939,6 @@ async def main():
     try:
         entries = await process_files(
             files=md_files,
-            docs_dir=args.docs_dir,
             llm=llm,
             max_chars=args.max_chars,
             existing_catalog=existing_catalog,
@@ -453,6 +946,9 @@ async def main():
             incremental=args.incremental,
             dry_run=args.dry_run,
             branch_map=branch_map,
+            batch_size=max(1, args.batch_size),
+            partial_path=None if args.dry_run else partial_path,
+            resumed=frozenset(resumed),
         )
     finally:
         await llm.close()
@@ -461,11 +957,14 @@ async def main():
 
     if not args.dry_run:
         # Write catalog
-        write_catalog(entries, args.output)
+        write_catalog(entries, args.output, existing_catalog, raw_lines)
 
         # Save hash cache for incremental mode
         save_hash_cache(HASH_CACHE_FILE, hash_cache)
 
+        # Everything is in the catalog now; drop the progress file
+        partial_path.unlink(missing_ok=True)
+
         # Summary
         branch_counts = {}
         for e in entries:
@@ -1,10 +1,16 @@
 #!/usr/bin/env python3
 """Main entry point for seekdb plugin installer."""
 
+import os
 import sys
 import shutil
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Set, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 
 try:
     import questionary
@@ -34,6 +40,13 @@ TOOL_CONFIGS: Dict[str, str] = {
     "Trae": ".trae/skills"
 }
 
+# Prepared once at import: tool name -> (path, is_global). Global paths
+# (starting with ~) are already expanded; others are project-relative.
+_TOOL_PATHS: Dict[str, Tuple[Path, bool]] = {
+    name: (Path(raw).expanduser(), True) if raw.startswith("~") else (Path(raw), False)
+    for name, raw in TOOL_CONFIGS.items()
+}
+
 # Available skills to install
 AVAILABLE_SKILLS = [
     "seekdb",
@@ -57,35 +70,120 @@ def get_package_skills_dir() -> Path:
 
 def get_tool_skills_path(tool_name: str, project_root: Path) -> Path:
     """Get the full path to the skills directory for a given tool."""
-    skills_dir_name = TOOL_CONFIGS.get(tool_name)
-    if not skills_dir_name:
-        raise ValueError(f"Unknown tool: {tool_name}")
-    path = Path(skills_dir_name)
-    if skills_dir_name.startswith("~"):
-        return path.expanduser()
-    return project_root / skills_dir_name
+    try:
+        path, is_global = _TOOL_PATHS[tool_name]
+    except KeyError:
+        raise ValueError(f"Unknown tool: {tool_name}") from None
+    return path if is_global else project_root / path
 
 
 def is_global_tool_path(tool_name: str) -> bool:
     """True if this tool uses a global/user path (e.g. ~/.openclaw/...) instead of project-relative path."""
-    path = TOOL_CONFIGS.get(tool_name, "")
-    return path.startswith("~")
+    return _TOOL_PATHS.get(tool_name, (None, False))[1]
+
+
+# Linux ioctl that makes dst share src's data blocks (copy-on-write)
+_FICLONE = 0x40049409
+
+
+def _clone_file(src, dst, *, follow_symlinks=True):
+    """Copy a file as a copy-on-write reflink where the filesystem supports it.
+
+    btrfs/XFS clone the extents instantly; everywhere else this falls back
+    to a regular shutil.copy2.
+    """
+    if fcntl is not None and sys.platform.startswith("linux"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst, follow_symlinks=follow_symlinks)
+            return dst
+        except OSError:
+            pass
+    return shutil.copy2(src, dst, follow_symlinks=follow_symlinks)
+
+
+def _scan_tree(root: Path) -> Tuple[Dict[str, tuple], Set[str]]:
+    """Return ({relative file path: signature}, {relative dir paths}) under root.
+
+    Symlinks are never followed: a link (to a file or a directory) is listed
+    as a file whose signature is ("symlink", link target); regular files
+    have (size, mtime_ns).
+    """
+    files: Dict[str, tuple] = {}
+    dirs: Set[str] = set()
+    stack = [""]
+    while stack:
+        rel_dir = stack.pop()
+        with os.scandir(root / rel_dir) as it:
+            for entry in it:
+                rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                if entry.is_symlink():
+                    files[rel] = ("symlink", os.readlink(entry.path))
+                elif entry.is_dir(follow_symlinks=False):
+                    dirs.add(rel)
+                    stack.append(rel)
+                else:
+                    st = entry.stat(follow_symlinks=False)
+                    files[rel] = (st.st_size, st.st_mtime_ns)
+    return files, dirs
+
+
+def _sync_tree(source_dir: Path, target_dir: Path) -> None:
+    """Make target_dir mirror source_dir, rewriting only files that differ.
+
+    Files are compared by (size, mtime_ns); copies preserve mtime, so an
+    unchanged reinstall is a pure metadata scan. Symlinks are mirrored as
+    links; nothing is ever written through a link in either tree.
+    """
+    src_files, src_dirs = _scan_tree(source_dir)
+    dst_files, dst_dirs = _scan_tree(target_dir)
+
+    # Drop anything the source no longer has (parents sort before children)
+    for rel in dst_files.keys() - src_files.keys():
+        (target_dir / rel).unlink()
+    for rel in sorted(dst_dirs - src_dirs):
+        stale = target_dir / rel
+        if stale.exists():
+            shutil.rmtree(stale)
+
+    for rel in sorted(src_dirs - dst_dirs):
+        (target_dir / rel).mkdir(exist_ok=True)
+
+    for rel, sig in src_files.items():
+        if dst_files.get(rel) == sig:
+            continue
+        dst = target_dir / rel
+        tmp = dst.with_name(f".{dst.name}.tmp")
+        tmp.unlink(missing_ok=True)
+        if sig[0] == "symlink":
+            os.symlink(sig[1], tmp)
+        else:
+            _clone_file(source_dir / rel, tmp)
+        os.replace(tmp, dst)
 
 
 def copy_skill(source_skill_dir: Path, target_skills_dir: Path, skill_name: str) -> bool:
-    """Copy a skill directory to the target location."""
+    """Copy a skill directory to the target location.
+
+    An existing installation is updated in place: only added or changed
+    files are written and files removed from the skill are deleted.
+    """
     target_skill_dir = target_skills_dir / skill_name
     
     try:
-        # Remove existing skill if it exists
-        if target_skill_dir.exists():
-            shutil.rmtree(target_skill_dir)
-        
         # Create parent directory if it doesn't exist
         target_skills_dir.mkdir(parents=True, exist_ok=True)
         
-        # Copy the skill directory
-        shutil.copytree(source_skill_dir, target_skill_dir)
+        if target_skill_dir.is_dir() and not target_skill_dir.is_symlink():
+            _sync_tree(source_skill_dir, target_skill_dir)
+            return True
+        
+        # Replace whatever is in the way (file or symlink), then copy fresh
+        if target_skill_dir.is_symlink() or target_skill_dir.exists():
+            target_skill_dir.unlink()
+        shutil.copytree(source_skill_dir, target_skill_dir, symlinks=True,
+                        copy_function=_clone_file)
         
         return True
     except Exception as e:
@@ -1,5 +1,8 @@
 #!/usr/bin/env python3
-"""Sync skills into the package, run ``uv build``, then remove the copy.
+"""Run ``uv build`` with the project-root skills packaged in place.
+
+``pyproject.toml`` maps ``skills/`` onto ``seekdb_plugin_installer.skills``,
+so nothing is copied into ``src/`` before building.
 
 Run from the ``agent-skills`` directory::
 
@@ -15,7 +18,6 @@ from pathlib import Path
 def main() -> None:
     root = Path(__file__).resolve().parent
     src = root / "skills"
-    dst = root / "src" / "seekdb_plugin_installer" / "skills"
 
     if not src.exists():
         raise SystemExit("skills/ directory not found in project root. Please create it first.")
@@ -26,25 +28,13 @@ def main() -> None:
             "uv is not installed or not on PATH. See https://docs.astral.sh/uv/"
         )
 
-    # 1. Sync skills -> package
-    if dst.exists():
-        shutil.rmtree(dst)
-    shutil.copytree(src, dst, ignore=shutil.ignore_patterns("__pycache__"))
-    print("Synced skills/ -> src/seekdb_plugin_installer/skills/")
-
-    try:
-        # 2. Build wheel (PEP 517 via uv)
-        print("Building wheel (uv build)...")
-        subprocess.run(
-            [uv, "build"],
-            cwd=root,
-            check=True,
-        )
-    finally:
-        # 3. Remove skills from package (restore to only project root)
-        if dst.exists():
-            shutil.rmtree(dst)
-            print("Removed src/seekdb_plugin_installer/skills/")
+    # Build sdist + wheel (PEP 517 via uv); skills/ is picked up via package-dir
+    print("Building wheel (uv build)...")
+    subprocess.run(
+        [uv, "build"],
+        cwd=root,
+        check=True,
+    )
 
     print("Build complete, artifacts in dist/")
 
@@ -1,8 +1,20 @@
 """Tests for import_to_seekdb module."""
-import pandas as pd
+import os
+import sys
+import threading
+import types
 
+import pandas as pd
+import pytest
 
-from import_to_seekdb import read_file, import_to_seekdb,client
+import import_to_seekdb as import_module
+from import_to_seekdb import (
+    PARQUET_CACHE_SUFFIX,
+    client,
+    import_to_seekdb,
+    iter_file_chunks,
+    read_file,
+)
 
 
 def test_read_csv_file(tmp_path):
@@ -63,3 +75,227 @@ def test_import_to_seekdb(tmp_path):
         file_path, vectorize_column, collection_name)
     assert inserted_collection_name == collection_name
     assert count == 2
+
+
+def test_iter_file_chunks_csv(tmp_path):
+    """Test CSV files are streamed in chunks of at most chunksize rows."""
+    csv_file = tmp_path / "rows.csv"
+    csv_file.write_text("n,label\n" + "".join(f"{i},row{i}\n" for i in range(5)))
+
+    chunks = list(iter_file_chunks(str(csv_file), chunksize=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    pd.testing.assert_frame_equal(
+        pd.concat(chunks, ignore_index=True), read_file(str(csv_file)))
+
+
+def test_iter_file_chunks_xlsx_and_empty_csv(tmp_path):
+    """Test Excel files are sliced into chunks and empty files yield one chunk."""
+    xlsx_file = tmp_path / "rows.xlsx"
+    pd.DataFrame({"n": [1, 2, 3]}).to_excel(str(xlsx_file), index=False)
+    empty_csv = tmp_path / "empty.csv"
+    empty_csv.write_text("n,label\n")
+
+    chunks = list(iter_file_chunks(str(xlsx_file), chunksize=2, cache=False))
+    empty = list(iter_file_chunks(str(empty_csv), chunksize=2))
+
+    assert [chunk["n"].tolist() for chunk in chunks] == [[1, 2], [3]]
+    assert [(len(chunk), list(chunk.columns)) for chunk in empty] == [(0, ["n", "label"])]
+
+
+def test_excel_parquet_cache_reused_until_source_changes(tmp_path, monkeypatch):
+    """Test the Parquet cache is read while fresh and rebuilt once stale."""
+    pytest.importorskip("pyarrow")
+    xlsx_file = tmp_path / "products.xlsx"
+    cache_file = tmp_path / f"products.xlsx{PARQUET_CACHE_SUFFIX}"
+    pd.DataFrame({"Product": ["Laptop"], "Price": [1000]}).to_excel(str(xlsx_file), index=False)
+
+    read_file(str(xlsx_file))
+    assert cache_file.exists()
+
+    # A fresh cache is read without parsing the workbook
+    real_read_excel = pd.read_excel
+
+    def fail_read_excel(*args, **kwargs):
+        raise AssertionError("workbook parsed despite a fresh cache")
+
+    monkeypatch.setattr(import_module.pd, "read_excel", fail_read_excel)
+    assert read_file(str(xlsx_file))["Product"].tolist() == ["Laptop"]
+    monkeypatch.setattr(import_module.pd, "read_excel", real_read_excel)
+
+    # A source newer than the cache is parsed again and re-cached
+    pd.DataFrame({"Product": ["Phone"], "Price": [800]}).to_excel(str(xlsx_file), index=False)
+    cache_mtime = cache_file.stat().st_mtime_ns
+    os.utime(xlsx_file, ns=(cache_mtime + 10**9, cache_mtime + 10**9))
+
+    assert read_file(str(xlsx_file))["Product"].tolist() == ["Phone"]
+    assert pd.read_parquet(cache_file)["Product"].tolist() == ["Phone"]
+
+    # So is a different file copied in with an older mtime (as cp -p does)
+    pd.DataFrame({"Product": ["Tablet", "Watch"], "Price": [500, 300]}).to_excel(str(xlsx_file), index=False)
+    os.utime(xlsx_file, ns=(10**18, 10**18))
+
+    assert read_file(str(xlsx_file))["Product"].tolist() == ["Tablet", "Watch"]
+
+
+def test_excel_parquet_cache_per_source_file(tmp_path):
+    """Test sibling .xlsx and .xls files with one stem get separate caches."""
+    pytest.importorskip("pyarrow")
+    xlsx_file = tmp_path / "data.xlsx"
+    xls_file = tmp_path / "data.xls"
+    pd.DataFrame({"Product": ["Laptop"]}).to_excel(str(xlsx_file), index=False)
+    # pandas picks the reader from the file content, so an .xlsx body will do
+    pd.DataFrame({"Product": ["Phone"]}).to_excel(str(xls_file), index=False, engine="openpyxl")
+
+    for _ in range(2):
+        assert read_file(str(xlsx_file))["Product"].tolist() == ["Laptop"]
+        assert read_file(str(xls_file))["Product"].tolist() == ["Phone"]
+    assert sorted(p.name for p in tmp_path.glob(f"*{PARQUET_CACHE_SUFFIX}")) == [
+        f"data.xls{PARQUET_CACHE_SUFFIX}", f"data.xlsx{PARQUET_CACHE_SUFFIX}"]
+
+
+def test_excel_no_cache_ignores_and_skips_parquet_cache(tmp_path):
+    """Test cache=False neither reads an existing cache nor writes one."""
+    pytest.importorskip("pyarrow")
+    xlsx_file = tmp_path / "products.xlsx"
+    cache_file = tmp_path / f"products.xlsx{PARQUET_CACHE_SUFFIX}"
+    pd.DataFrame({"Product": ["Laptop"]}).to_excel(str(xlsx_file), index=False)
+
+    assert read_file(str(xlsx_file), cache=False)["Product"].tolist() == ["Laptop"]
+    assert not cache_file.exists()
+
+    # Even a cache that looks fresh is not consulted
+    pd.DataFrame({"Product": ["from cache"]}).to_parquet(cache_file)
+    assert read_file(str(xlsx_file), cache=False)["Product"].tolist() == ["Laptop"]
+
+
+def test_cli_no_cache_flag(tmp_path, monkeypatch):
+    """Test --no-cache is passed through to import_to_seekdb."""
+    calls = []
+
+    def record_import(**kwargs):
+        calls.append(kwargs)
+        return "products", 0
+
+    monkeypatch.setattr(import_module, "import_to_seekdb", record_import)
+    for argv in (["products.xlsx"], ["products.xlsx", "--no-cache"]):
+        monkeypatch.setattr(sys, "argv", ["import_to_seekdb.py", "import", *argv])
+        import_module.main()
+
+    assert [call["cache"] for call in calls] == [True, False]
+
+
+class _RecordingCollection:
+    """Fake collection recording add() batches and the threads they ran on."""
+
+    def __init__(self, fail_on_batch=None):
+        self.fail_on_batch = fail_on_batch
+        self.batches = []
+        self.threads = set()
+
+    def add(self, ids, metadatas, documents=None, embeddings=None):
+        self.threads.add(threading.get_ident())
+        if len(self.batches) + 1 == self.fail_on_batch:
+            raise RuntimeError(f"batch {self.fail_on_batch} rejected")
+        self.batches.append([metadata["n"] for metadata in metadatas])
+
+    def count(self):
+        return sum(len(batch) for batch in self.batches)
+
+    def peek(self, limit):
+        return {"ids": [], "documents": [], "metadatas": []}
+
+
+def _server_import(tmp_path, monkeypatch, collection, **kwargs):
+    """Import 10 rows in batches of 2 against a fake server collection."""
+    csv_file = tmp_path / "rows.csv"
+    csv_file.write_text("n\n" + "".join(f"{i}\n" for i in range(10)))
+    fake_client = types.SimpleNamespace(get_or_create_collection=lambda **_: collection)
+    monkeypatch.setattr(import_module, "host", "127.0.0.1")
+    monkeypatch.setattr(import_module, "client", fake_client)
+    return import_to_seekdb(str(csv_file), batch_size=2, **kwargs)
+
+
+def test_server_import_inserts_in_order_on_one_thread(tmp_path, monkeypatch):
+    """Test server-mode batches are written in order by a single insert thread."""
+    collection = _RecordingCollection()
+
+    assert _server_import(tmp_path, monkeypatch, collection, max_pending=2) == ("rows", 10)
+    assert collection.batches == [[0, 1], [2, 3], [4, 5], [6, 7], [8, 9]]
+    assert len(collection.threads) == 1
+    assert threading.get_ident() not in collection.threads
+
+
+def test_server_import_stops_at_failed_batch(tmp_path, monkeypatch, capsys):
+    """Test a failed batch is re-raised and the batches queued behind it are skipped."""
+    collection = _RecordingCollection(fail_on_batch=3)
+
+    with pytest.raises(RuntimeError, match="batch 3 rejected"):
+        _server_import(tmp_path, monkeypatch, collection, max_pending=4)
+
+    assert collection.batches == [[0, 1], [2, 3]]
+    assert "Imported 4 records" in capsys.readouterr().out
+
+
+class _KeyedCollection:
+    """Fake collection storing upserted metadatas by id."""
+
+    def __init__(self):
+        self.records = {}
+
+    def upsert(self, ids, metadatas, documents=None, embeddings=None):
+        self.records.update(zip(ids, metadatas))
+
+    def count(self):
+        return len(self.records)
+
+    def peek(self, limit):
+        return {"ids": [], "documents": [], "metadatas": []}
+
+
+def _keyed_import(csv_file, monkeypatch, collection):
+    """Import csv_file keyed on its sku column into a fake collection."""
+    fake_client = types.SimpleNamespace(get_or_create_collection=lambda **_: collection)
+    monkeypatch.setattr(import_module, "client", fake_client)
+    return import_to_seekdb(str(csv_file), id_column="sku")
+
+
+def test_import_id_column_rerun_updates_records(tmp_path, monkeypatch):
+    """Test re-importing with --id-column updates rows instead of adding new ones."""
+    csv_file = tmp_path / "products.csv"
+    collection = _KeyedCollection()
+    csv_file.write_text("sku,price\nA1,10\nB2,20\n")
+    assert _keyed_import(csv_file, monkeypatch, collection) == ("products", 2)
+    ids = set(collection.records)
+
+    csv_file.write_text("sku,price\nA1,15\nB2,20\n")
+    assert _keyed_import(csv_file, monkeypatch, collection) == ("products", 2)
+
+    assert set(collection.records) == ids
+    assert sorted(record["price"] for record in collection.records.values()) == [15, 20]
+
+
+def test_import_id_column_rejects_duplicate_keys(tmp_path, monkeypatch):
+    """Test duplicate keys are rejected before their chunk is written."""
+    csv_file = tmp_path / "products.csv"
+    csv_file.write_text("sku,price\nA1,10\nB2,20\nA1,30\n")
+    collection = _KeyedCollection()
+
+    with pytest.raises(ValueError, match="duplicate values \\(e.g. 'A1'\\)"):
+        _keyed_import(csv_file, monkeypatch, collection)
+    assert collection.records == {}
+
+
+def test_import_id_column_rejects_duplicates_across_chunks(tmp_path, monkeypatch):
+    """Test a key repeated in a later chunk is rejected too."""
+    csv_file = tmp_path / "products.csv"
+    csv_file.write_text("sku,price\nA1,10\nB2,20\nC3,30\nA1,40\n")
+    collection = _KeyedCollection()
+    real_iter_file_chunks = iter_file_chunks
+    monkeypatch.setattr(
+        import_module, "iter_file_chunks",
+        lambda file_path, **kwargs: real_iter_file_chunks(file_path, chunksize=2, **kwargs))
+
+    with pytest.raises(ValueError, match="duplicate values \\(e.g. 'A1'\\)"):
+        _keyed_import(csv_file, monkeypatch, collection)
+    assert len(collection.records) == 2
@@ -0,0 +1,31 @@
+"""Tests for read_excel module."""
+import openpyxl
+
+from read_excel import open_excel, sheet_dimensions
+
+
+def _write_workbook(path):
+    """Write a workbook with a data sheet, a header-only sheet and an empty sheet."""
+    wb = openpyxl.Workbook()
+    data = wb.active
+    data.title = "Data"
+    data.append(["Name", "Price", "Stock"])
+    for row in (["Laptop", 1000, 5], ["Phone", 800, None], ["Tablet", 500, 12]):
+        data.append(row)
+    wb.create_sheet("Header").append(["Name", "Price"])
+    wb.create_sheet("Empty")
+    wb.save(path)
+
+
+def test_sheet_dimensions_match_parsed_shape(tmp_path):
+    """Test sheet_dimensions agrees with fully parsing every sheet."""
+    xlsx_file = tmp_path / "workbook.xlsx"
+    _write_workbook(xlsx_file)
+
+    with open_excel(str(xlsx_file)) as xl:
+        expected = [(name, *xl.parse(name).shape) for name in xl.sheet_names]
+        shared = sheet_dimensions(str(xlsx_file), xl)
+
+    assert expected == [("Data", 3, 3), ("Header", 0, 2), ("Empty", 0, 0)]
+    assert sheet_dimensions(str(xlsx_file)) == expected
+    assert shared == expected
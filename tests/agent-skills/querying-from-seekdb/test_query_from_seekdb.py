@@ -1,77 +1,299 @@
 """Tests for query_from_seekdb module."""
+import codecs
+import json
+import os
+import sys
+import types
+from pathlib import Path
+
+import pandas as pd
 import pytest
 
+import query_from_seekdb
 from query_from_seekdb import (
     client,
     get_collection,
     get_by_filter,
+    _iter_get_pages,
     hybrid_search,
     list_collections,
-    collection_info
+    collection_info,
+    export_to_file,
+    output_results,
+    results_to_dataframe,
+)
+
+
+# Test collection name; suffixed per pytest-xdist worker (pytest -n auto) so
+# parallel workers each own their collection
+_XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+TEST_COLLECTION = f"test_query_collection_{_XDIST_WORKER}" if _XDIST_WORKER else "test_query_collection"
+
 
+# Test data shared by the fixture and the assertions below
+_IDS = ("doc1", "doc2", "doc3", "doc4", "doc5")
+
+_DOCUMENTS = (
+    "Machine learning is a subset of artificial intelligence",
+    "Python is a popular programming language for data science",
+    "Vector databases enable semantic search capabilities",
+    "Neural networks are inspired by the human brain structure",
+    "Natural language processing helps computers understand text",
+)
+
+_METADATAS = (
+    {"category": "AI", "score": 95, "year": 2023},
+    {"category": "Programming", "score": 88, "year": 2022},
+    {"category": "Database", "score": 92, "year": 2024},
+    {"category": "AI", "score": 90, "year": 2023},
+    {"category": "NLP", "score": 85, "year": 2021},
 )
 
 
-# Test collection name
-TEST_COLLECTION = "test_query_collection"
+def _holds_test_data(collection) -> bool:
+    """Return True if collection contains exactly the module's test data."""
+    if collection.count() != len(_IDS):
+        return False
+    stored = collection.get(ids=list(_IDS), include=["documents", "metadatas"])
+    return sorted(zip(stored["ids"], stored["documents"], stored["metadatas"]),
+                  key=lambda row: row[0]) == list(zip(_IDS, _DOCUMENTS, _METADATAS))
 
 
 @pytest.fixture(scope="module")
 def setup_test_collection():
-    """Create and populate a test collection for querying."""
-    # Clean up if exists
+    """Create and populate a test collection for querying.
+
+    With KEEP_TEST_DB set, a collection left by an earlier run is reused
+    when it still holds exactly the test data, and is kept afterwards.
+    """
+    keep = bool(os.environ.get("KEEP_TEST_DB"))
+
+    # Clean up if exists, unless it can be reused as is
     if client.has_collection(TEST_COLLECTION):
+        if keep and _holds_test_data(client.get_collection(TEST_COLLECTION)):
+            yield client.get_collection(TEST_COLLECTION)
+            return
         client.delete_collection(TEST_COLLECTION)
 
     # Create collection with default embedding function
     collection = client.get_or_create_collection(name=TEST_COLLECTION)
 
     # Add test data
-    documents = [
-        "Machine learning is a subset of artificial intelligence",
-        "Python is a popular programming language for data science",
-        "Vector databases enable semantic search capabilities",
-        "Neural networks are inspired by the human brain structure",
-        "Natural language processing helps computers understand text",
-    ]
-
-    ids = ["doc1", "doc2", "doc3", "doc4", "doc5"]
-
-    metadatas = [
-        {"category": "AI", "score": 95, "year": 2023},
-        {"category": "Programming", "score": 88, "year": 2022},
-        {"category": "Database", "score": 92, "year": 2024},
-        {"category": "AI", "score": 90, "year": 2023},
-        {"category": "NLP", "score": 85, "year": 2021},
-    ]
-
-    collection.add(ids=ids, documents=documents, metadatas=metadatas)
+    collection.add(ids=list(_IDS), documents=list(_DOCUMENTS),
+                   metadatas=[dict(m) for m in _METADATAS])
 
     yield collection
 
     # Cleanup
-    client.delete_collection(TEST_COLLECTION)
+    if not keep:
+        client.delete_collection(TEST_COLLECTION)
 
 
 def test_get_collection(setup_test_collection):
     """Test getting an existing collection."""
     collection = get_collection(TEST_COLLECTION)
     assert collection is not None
-    assert collection.count() == 5
+    assert collection.count() == len(_IDS)
+
+
+def test_get_collection_not_found(setup_test_collection):
+    """Test a missing collection is reported as not found."""
+    with pytest.raises(ValueError, match="not found"):
+        get_collection("test_query_missing_collection")
+
+
+def test_get_collection_single_lookup_on_miss(monkeypatch):
+    """Test a missing collection costs one get_collection call, no has_collection probe."""
+    class MissingClient:
+        def has_collection(self, name):
+            raise AssertionError("has_collection probe")
+
+        def get_collection(self, name):
+            raise ValueError(f"Collection '{name}' does not exist")
+
+        def list_collections(self):
+            return ["other"]
+
+    monkeypatch.setattr(query_from_seekdb, "_client", MissingClient)
+    with pytest.raises(ValueError, match="not found.*Available collections: \\['other'\\]"):
+        get_collection("test_query_uncached_collection")
+
+
+def test_get_collection_propagates_client_errors(monkeypatch):
+    """Test connection errors are not reported as a missing collection."""
+    class FailingClient:
+        def get_collection(self, name):
+            raise ConnectionError("server unreachable")
+
+    monkeypatch.setattr(query_from_seekdb, "_client", FailingClient)
+    with pytest.raises(ConnectionError, match="server unreachable"):
+        get_collection("test_query_uncached_collection")
 
 
 def test_get_by_filter_scalar(setup_test_collection):
     """Test filtering documents by scalar metadata field."""
     where = {"category": "AI"}
     result = get_by_filter(collection_name=TEST_COLLECTION, where=where)
-    assert set(result["ids"][0]) == {"doc1", "doc4"}
+    assert sorted(result["ids"][0]) == ["doc1", "doc4"]
+
+
+class _PagedCollection:
+    """Fake collection serving get() pages over numbered ids."""
+
+    def __init__(self, n):
+        self.ids = [f"id{i}" for i in range(n)]
+        self.get_calls = []
+
+    def get(self, limit=None, offset=0, **kwargs):
+        self.get_calls.append((limit, offset))
+        ids = self.ids[offset:None if limit is None else offset + limit]
+        return {"ids": ids, "documents": ids, "metadatas": [{"n": i} for i in ids]}
+
+
+def test_iter_get_pages_stops_at_short_page():
+    """Test paging stops at the first page shorter than the limit."""
+    collection = _PagedCollection(5)
+    pages = list(_iter_get_pages(collection, {}, n_results=10, page_size=2))
+    assert [len(page["ids"]) for page in pages] == [2, 2, 1]
+    assert collection.get_calls == [(2, 0), (2, 2), (2, 4)]
+
+
+def test_get_by_filter_pages_past_page_size(monkeypatch):
+    """Test n_results above GET_PAGE_SIZE is fetched in pages from offset."""
+    collection = _PagedCollection(10)
+    monkeypatch.setattr(query_from_seekdb, "get_collection", lambda name: collection)
+    monkeypatch.setattr(query_from_seekdb, "GET_PAGE_SIZE", 2)
+    result = get_by_filter("paged", where={"n": 1}, n_results=5, offset=1)
+    assert result["ids"] == [["id1", "id2", "id3", "id4", "id5"]]
+    assert collection.get_calls == [(2, 1), (2, 3), (1, 5)]
+
+
+def _run_main(monkeypatch, capsys, *argv):
+    """Run the CLI with argv and return its captured stdout."""
+    monkeypatch.setattr(sys, "argv", ["query_from_seekdb.py", *argv])
+    query_from_seekdb.main()
+    return capsys.readouterr().out
+
+
+def test_scalar_search_cli_returns_all_matches_by_default(monkeypatch, capsys):
+    """Test scalar search pages through every match unless --n-results is given."""
+    collection = _PagedCollection(7)
+    monkeypatch.setattr(query_from_seekdb, "get_collection", lambda name: collection)
+    monkeypatch.setattr(query_from_seekdb, "GET_PAGE_SIZE", 3)
+    out = _run_main(monkeypatch, capsys, "paged", "--where", '{"n": 1}', "--json")
+    assert len(json.loads(out)["ids"][0]) == 7
+    assert collection.get_calls == [(3, 0), (3, 3), (3, 6)]
+
+
+class _WideningCollection(_PagedCollection):
+    """Fake paged collection whose later records gain a metadata key."""
+
+    def get(self, limit=None, offset=0, **kwargs):
+        page = super().get(limit=limit, offset=offset, **kwargs)
+        page["metadatas"] = [{**meta, "late": "x,y"} if meta["n"] >= "id4" else meta
+                             for meta in page["metadatas"]]
+        return page
+
+
+def test_scalar_search_cli_streams_pages_to_csv(monkeypatch, capsys, tmp_path):
+    """Test --output .csv writes scalar pages without merging them first."""
+    collection = _WideningCollection(5)
+    monkeypatch.setattr(query_from_seekdb, "get_collection", lambda name: collection)
+    monkeypatch.setattr(query_from_seekdb, "GET_PAGE_SIZE", 2)
+    expected = tmp_path / "expected.csv"
+    output_results(get_by_filter("paged", where={"n": 1}), str(expected), as_json=False)
+
+    def no_merge(*args, **kwargs):
+        raise AssertionError("pages were merged before export")
+
+    monkeypatch.setattr(query_from_seekdb, "get_by_filter", no_merge)
+    out = _run_main(monkeypatch, capsys, "paged", "--where", '{"n": 1}',
+                    "--output", str(tmp_path / "paged.csv"))
+
+    content = (tmp_path / "paged.csv").read_bytes()
+    assert "Exported 5 records" in out
+    assert content == expected.read_bytes()
+    assert content.removeprefix(codecs.BOM_UTF8).splitlines()[:2] == [
+        b"id,document,n,late", b"id0,id0,id0,"]
+
+
+def test_scalar_search_cli_offset(monkeypatch, capsys):
+    """Test --offset and --n-results select a page of scalar matches."""
+    collection = _PagedCollection(7)
+    monkeypatch.setattr(query_from_seekdb, "get_collection", lambda name: collection)
+    out = _run_main(monkeypatch, capsys, "paged", "--where", '{"n": 1}',
+                    "--n-results", "3", "--offset", "2", "--json")
+    assert json.loads(out)["ids"] == [["id2", "id3", "id4"]]
+    assert collection.get_calls == [(3, 2)]
+
+
+class _EchoCollection:
+    """Fake collection answering each hybrid search with a hit named after the query."""
+
+    def __init__(self):
+        self.queries = []
+
+    def hybrid_search(self, query, knn, rank, n_results, include):
+        text = query["where_document"]["$contains"]
+        self.queries.append(text)
+        return {"ids": [[f"hit:{text}"]], "documents": [[text]],
+                "metadatas": [[{"n_results": n_results}]], "distances": [[0.5]]}
+
+
+def test_multi_query_cli_json(monkeypatch, capsys):
+    """Test repeated --query-text runs each query and --json reports one entry per query."""
+    collection = _EchoCollection()
+    monkeypatch.setattr(query_from_seekdb, "get_collection", lambda name: collection)
+    out = _run_main(monkeypatch, capsys, "echo", "--query-text", "phone", "-q", "laptop",
+                    "--n-results", "2", "--json")
+    assert collection.queries == ["phone", "laptop"]
+    assert json.loads(out) == [
+        {"query": text, "results": {"ids": [[f"hit:{text}"]], "documents": [[text]],
+                                    "metadatas": [[{"n_results": 2}]], "distances": [[0.5]]}}
+        for text in ("phone", "laptop")
+    ]
+
+
+def test_multi_query_cli_prints_each_query(monkeypatch, capsys):
+    """Test multiple queries are printed as one section per query, in order."""
+    collection = _EchoCollection()
+    monkeypatch.setattr(query_from_seekdb, "get_collection", lambda name: collection)
+    out = _run_main(monkeypatch, capsys, "echo", "--query-text", "phone", "--query-text", "laptop")
+    assert out.index("Query: phone") < out.index("hit:phone") < out.index("Query: laptop")
+    assert "hit:laptop" in out
+
+
+def test_single_query_text_is_not_split(monkeypatch, capsys):
+    """Test a single --query-text is searched verbatim, even with || or commas in it."""
+    collection = _EchoCollection()
+    monkeypatch.setattr(query_from_seekdb, "get_collection", lambda name: collection)
+    out = _run_main(monkeypatch, capsys, "echo", "--query-text", "a || b, c", "--json")
+    assert collection.queries == ["a || b, c"]
+    assert json.loads(out)["ids"] == [["hit:a || b, c"]]
+
+
+@pytest.mark.parametrize("argv", [
+    ("--query-text", "  "),
+    ("--query-text", "phone", "--query-text", " "),
+    ("--query-text", "phone", "--query-text", "laptop", "--output", "results.csv"),
+])
+def test_query_text_cli_usage_errors(monkeypatch, capsys, tmp_path, argv):
+    """Test empty query texts and --output with several queries are usage errors."""
+    collection = _EchoCollection()
+    monkeypatch.setattr(query_from_seekdb, "get_collection", lambda name: collection)
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(SystemExit) as exc_info:
+        _run_main(monkeypatch, capsys, "echo", *argv)
+    assert exc_info.value.code == 2
+    assert collection.queries == []
+    assert not (tmp_path / "results.csv").exists()
 
 
 def test_hybrid_search_fulltext_semantic(setup_test_collection):
     query_text = "Vector databases"
     result = hybrid_search(collection_name=TEST_COLLECTION,
                            query_text=query_text, n_results=1)
-    assert set(result["ids"][0]) == {"doc3"}
+    assert result["ids"][0] == ["doc3"]
 
 
 def test_hybrid_search_fulltext_semantic_scalar(setup_test_collection):
@@ -79,21 +301,119 @@ def test_hybrid_search_fulltext_semantic_scalar(setup_test_collection):
     where = {"category": "AI", "score": 90}
     result = hybrid_search(collection_name=TEST_COLLECTION,
                            query_text=query_text, where=where, n_results=1)
-    assert set(result["ids"][0]) == {"doc4"}
+    assert result["ids"][0] == ["doc4"]
 
 def test_list_collections(setup_test_collection):
     """Test listing all collections."""
     collections = list_collections()
-    assert collections is not None
-    assert len(collections) > 0
-    collection_names = [col.name if hasattr(col, 'name') else str(col) for col in collections]
-    assert TEST_COLLECTION in collection_names
+    assert collections
+    assert any(getattr(col, "name", str(col)) == TEST_COLLECTION
+               for col in collections)
 
 def test_collection_info(setup_test_collection):
     """Test getting collection info."""
     info = collection_info(TEST_COLLECTION)
     assert info is not None
     assert info["name"] == TEST_COLLECTION
-    assert info["count"] == 5
+    assert info["count"] == len(_IDS)
     assert info["preview"] is not None
-    assert len(info["preview"]["ids"]) == 3
\ No newline at end of file
+    assert len(info["preview"]["ids"]) == 3
+
+
+def test_info_all_cli(setup_test_collection, monkeypatch, capsys):
+    """Test --info-all prints count and preview for every collection."""
+    out = _run_main(monkeypatch, capsys, "--info-all")
+    section = out[out.index(f"Collection: {TEST_COLLECTION}\n"):]
+    assert f"Total records: {len(_IDS)}" in section.split("\nCollection: ")[0]
+    assert "Preview (first 3 records):" in section
+
+
+def test_export_to_file_csv_uses_lf(tmp_path):
+    """Test CSV export ends rows with LF regardless of platform."""
+    df = pd.DataFrame({"id": ["doc1", "doc2"], "category": ["AI", "NLP"]})
+    abs_path = export_to_file(df, str(tmp_path / "export.csv"))
+    content = Path(abs_path).read_bytes()
+    assert content.startswith(codecs.BOM_UTF8)
+    assert b"\r\n" not in content
+    assert content.count(b"\n") == len(df) + 1
+    assert content.removeprefix(codecs.BOM_UTF8).startswith(b"id,category\n")
+
+
+def test_export_to_file_xlsx_stringifies_nested_metadata(tmp_path):
+    """Test Excel export writes list/dict metadata as text and NaN as blank."""
+    from openpyxl import load_workbook
+
+    df = pd.DataFrame({
+        "id": ["doc1", "doc2"],
+        "score": [95, None],
+        "tags": [["ai", "ml"], {"lang": "en"}],
+    })
+    abs_path = export_to_file(df, str(tmp_path / "export.xlsx"), sheet_name="Results")
+    wb = load_workbook(abs_path, read_only=True)
+    try:
+        rows = list(wb["Results"].iter_rows(values_only=True))
+    finally:
+        wb.close()
+    assert rows == [
+        ("id", "score", "tags"),
+        ("doc1", 95, "['ai', 'ml']"),
+        ("doc2", None, "{'lang': 'en'}"),
+    ]
+
+
+def test_export_to_file_xlsx_streams_rows(tmp_path, monkeypatch):
+    """Test Excel export converts rows one by one, blanking nullable missing values."""
+    from openpyxl import load_workbook
+
+    df = pd.DataFrame({
+        "id": ["doc1", "doc2"],
+        "count": pd.array([3, None], dtype="Int64"),
+        "seen": pd.to_datetime(["2024-05-01", None]),
+    })
+
+    def no_copy(*args, **kwargs):
+        raise AssertionError("the whole frame was copied before writing")
+
+    monkeypatch.setattr(pd.DataFrame, "astype", no_copy)
+    abs_path = export_to_file(df, str(tmp_path / "export.xlsx"))
+    wb = load_workbook(abs_path, read_only=True)
+    try:
+        rows = list(wb["Data"].iter_rows(values_only=True))
+    finally:
+        wb.close()
+    # Date cells may read back as serial numbers, so only check the blanks there
+    assert rows[0] == ("id", "count", "seen")
+    assert rows[1][:2] == ("doc1", 3) and rows[1][2] is not None
+    assert rows[2] == ("doc2", None, None)
+
+
+def test_csv_export_independent_of_optional_writers(tmp_path, monkeypatch):
+    """Test CSV bytes don't depend on polars/pyarrow and match export_to_file."""
+    results = {
+        "ids": [["doc1", "doc2"]],
+        "distances": [[0.125, 0.5]],
+        "documents": [["Vectors, briefly", 'Say "hi"']],
+        "metadatas": [[{"score": 95, "tags": ["ai", "ml"]}, {"score": 88}]],
+    }
+    for name in ("polars", "pyarrow", "pyarrow.csv"):
+        monkeypatch.setitem(sys.modules, name, None)
+    output_results(results, str(tmp_path / "without.csv"), as_json=False)
+
+    # A polars stand-in whose output would differ from the built-in writer
+    class StubFrame:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def write_csv(self, path, **kwargs):
+            Path(path).write_bytes(b"polars\n")
+
+    monkeypatch.setitem(sys.modules, "polars", types.SimpleNamespace(DataFrame=StubFrame))
+    output_results(results, str(tmp_path / "with.csv"), as_json=False)
+    export_to_file(results_to_dataframe(results), str(tmp_path / "frame.csv"))
+
+    expected = (b"\xef\xbb\xbfid,distance,document,score,tags\n"
+                b"doc1,0.125,\"Vectors, briefly\",95,\"['ai', 'ml']\"\n"
+                b"doc2,0.5,\"Say \"\"hi\"\"\",88,\n")
+    assert (tmp_path / "without.csv").read_bytes() == expected
+    assert (tmp_path / "with.csv").read_bytes() == expected
+    assert (tmp_path / "frame.csv").read_bytes() == expected
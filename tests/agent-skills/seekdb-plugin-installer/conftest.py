@@ -0,0 +1,7 @@
+# pytest configuration for seekdb plugin installer tests
+import sys
+from pathlib import Path
+
+# Add the installer's src directory to Python path
+src_dir = Path(__file__).parent.parent.parent.parent / "agent-skills" / "src"
+sys.path.insert(0, str(src_dir))
@@ -0,0 +1,78 @@
+"""Tests for seekdb_plugin_installer copy_skill."""
+import os
+
+import pytest
+
+# The installer module exits at import without its questionary dependency
+pytest.importorskip("questionary")
+
+from seekdb_plugin_installer.main import copy_skill
+
+
+def _make_skill(root):
+    """Create a small skill tree and return its directory."""
+    skill = root / "source" / "demo-skill"
+    (skill / "scripts").mkdir(parents=True)
+    (skill / "SKILL.md").write_text("# Demo\n")
+    (skill / "scripts" / "run.py").write_text("print('v1')\n")
+    (skill / "scripts" / "old.py").write_text("print('old')\n")
+    return skill
+
+
+def test_reinstall_removes_stale_and_rewrites_changed(tmp_path):
+    """Test a reinstall mirrors the source and leaves unchanged files alone."""
+    skill = _make_skill(tmp_path)
+    target = tmp_path / "target"
+    assert copy_skill(skill, target, "demo-skill")
+    installed = target / "demo-skill"
+    unchanged_inode = (installed / "SKILL.md").stat().st_ino
+
+    (skill / "scripts" / "old.py").unlink()
+    (skill / "scripts" / "run.py").write_text("print('version 2')\n")
+    (skill / "references").mkdir()
+    (skill / "references" / "notes.md").write_text("notes\n")
+    (installed / "leftover.txt").write_text("not in the skill\n")
+    assert copy_skill(skill, target, "demo-skill")
+
+    assert sorted(p.relative_to(installed).as_posix() for p in installed.rglob("*")) == [
+        "SKILL.md", "references", "references/notes.md", "scripts", "scripts/run.py"]
+    assert (installed / "scripts" / "run.py").read_text() == "print('version 2')\n"
+    assert (installed / "SKILL.md").stat().st_ino == unchanged_inode
+
+
+def test_reinstall_mirrors_source_symlinks_as_links(tmp_path):
+    """Test a symlinked source directory is installed as a link, not a tree."""
+    skill = _make_skill(tmp_path)
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    (shared / "data.txt").write_text("shared\n")
+    target = tmp_path / "target"
+    assert copy_skill(skill, target, "demo-skill")
+
+    (skill / "shared").symlink_to(shared, target_is_directory=True)
+    assert copy_skill(skill, target, "demo-skill")
+
+    link = target / "demo-skill" / "shared"
+    assert link.is_symlink()
+    assert os.readlink(link) == str(shared)
+
+
+def test_reinstall_does_not_write_through_target_symlink(tmp_path):
+    """Test a symlinked directory in the install is replaced, not written into."""
+    skill = _make_skill(tmp_path)
+    target = tmp_path / "target"
+    assert copy_skill(skill, target, "demo-skill")
+
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "keep.txt").write_text("user data\n")
+    scripts = target / "demo-skill" / "scripts"
+    for path in scripts.iterdir():
+        path.unlink()
+    scripts.rmdir()
+    scripts.symlink_to(outside, target_is_directory=True)
+    assert copy_skill(skill, target, "demo-skill")
+
+    assert not scripts.is_symlink()
+    assert sorted(p.name for p in scripts.iterdir()) == ["old.py", "run.py"]
+    assert sorted(p.name for p in outside.iterdir()) == ["keep.txt"]
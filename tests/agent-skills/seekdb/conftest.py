@@ -0,0 +1,7 @@
+# pytest configuration for seekdb skill tests
+import sys
+from pathlib import Path
+
+# Add scripts directory to Python path
+scripts_dir = Path(__file__).parent.parent.parent.parent / "agent-skills" / "skills" / "seekdb" / "scripts"
+sys.path.insert(0, str(scripts_dir))
@@ -0,0 +1,183 @@
+"""Tests for generate_catalog module."""
+import asyncio
+import json
+import sys
+import threading
+
+import generate_catalog
+from generate_catalog import (
+    RateLimiter,
+    file_md5,
+    file_sig,
+    load_hash_cache,
+    partial_path_for,
+    process_files,
+)
+
+
+class StubLLM:
+    """Stand-in for LLMClient that records calls instead of hitting an API."""
+
+    def __init__(self, *args, concurrency=2, batch_replies=None, **kwargs):
+        self.concurrency = concurrency
+        self.batch_replies = batch_replies
+        self.single_calls = []
+        self.batch_calls = []
+
+    async def generate_description(self, path, content, max_chars):
+        self.single_calls.append(path)
+        return f"single: {path}"
+
+    async def generate_descriptions_batch(self, items, max_chars):
+        paths = [path for path, _ in items]
+        self.batch_calls.append(paths)
+        answered = self.batch_replies if self.batch_replies is not None else paths
+        return {path: f"batch: {path}" for path in paths if path in answered}
+
+    async def close(self):
+        pass
+
+
+def _write_docs(docs_dir, *names):
+    """Create markdown files under docs_dir and return (path, rel path) pairs."""
+    files = []
+    for name in names:
+        path = docs_dir / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"# {name}\n\nContent of {name}.\n")
+        files.append((path, name))
+    return files
+
+
+def _process(files, llm, **kwargs):
+    """Run process_files with defaults for everything the test doesn't set."""
+    params = {
+        "max_chars": 1000,
+        "existing_catalog": {},
+        "hash_cache": {},
+        "incremental": False,
+        "dry_run": False,
+        "branch_map": {},
+    }
+    params.update(kwargs)
+    return asyncio.run(process_files(files, llm, **params))
+
+
+def test_load_hash_cache_upgrades_legacy_md5_strings(tmp_path):
+    """Test a legacy path -> md5 cache is upgraded and reused by content."""
+    (a, a_rel), (b, b_rel) = _write_docs(tmp_path / "docs", "a.md", "b.md")
+    cache_file = tmp_path / "cache.json"
+    cache_file.write_text(json.dumps({a_rel: file_md5(a), b_rel: "0" * 32}))
+
+    hash_cache = load_hash_cache(cache_file)
+    assert hash_cache == {a_rel: {"md5": file_md5(a)}, b_rel: {"md5": "0" * 32}}
+
+    existing = {
+        a_rel: {"path": a_rel, "description": "kept"},
+        b_rel: {"path": b_rel, "description": "stale"},
+    }
+    llm = StubLLM()
+    entries = _process([(a, a_rel), (b, b_rel)], llm, existing_catalog=existing,
+                       hash_cache=hash_cache, incremental=True)
+
+    assert entries[0] is existing[a_rel]
+    assert entries[1] == {"path": b_rel, "description": f"single: {b_rel}"}
+    assert llm.single_calls == [b_rel]
+    # Verified entries gain the stat signature for the next run
+    assert hash_cache[a_rel] == {"sig": file_sig(a), "md5": file_md5(a)}
+
+
+def test_batch_reply_missing_paths_retried_individually(tmp_path):
+    """Test documents a batch reply leaves out are described one by one."""
+    files = _write_docs(tmp_path / "docs", "a.md", "b.md", "c.md")
+    llm = StubLLM(concurrency=1, batch_replies={"b.md"})
+    entries = _process(files, llm, batch_size=3)
+
+    # Files are queued in the order their hashing finishes
+    assert [sorted(call) for call in llm.batch_calls] == [["a.md", "b.md", "c.md"]]
+    assert sorted(llm.single_calls) == ["a.md", "c.md"]
+    assert [e["description"] for e in entries] == [
+        "single: a.md", "batch: b.md", "single: c.md"]
+
+
+def test_descriptions_start_before_hashing_finishes(tmp_path, monkeypatch):
+    """Test a file is described while later files are still being hashed."""
+    files = _write_docs(tmp_path / "docs", "a.md", "b.md")
+    described = threading.Event()
+    hashed_after_describe = []
+    real_md5 = generate_catalog.file_md5
+
+    def slow_md5(filepath):
+        if filepath.name == "b.md":
+            hashed_after_describe.append(described.wait(timeout=5))
+        return real_md5(filepath)
+
+    class SignallingLLM(StubLLM):
+        async def generate_description(self, path, content, max_chars):
+            described.set()
+            return await super().generate_description(path, content, max_chars)
+
+    monkeypatch.setattr(generate_catalog, "file_md5", slow_md5)
+    entries = _process(files, SignallingLLM(concurrency=1))
+
+    assert hashed_after_describe == [True]
+    assert [e["path"] for e in entries] == ["a.md", "b.md"]
+
+
+def test_main_resumes_from_partial_file(tmp_path, monkeypatch):
+    """Test an interrupted run's .partial entries are reused, not regenerated."""
+    docs_dir = tmp_path / "docs"
+    (a, a_rel), (b, b_rel) = _write_docs(docs_dir, "a.md", "b.md")
+    output = tmp_path / "catalog.jsonl"
+    partial = partial_path_for(output)
+    recovered = {"path": a_rel, "description": "recovered"}
+    record = {"entry": recovered, "hash": {"sig": file_sig(a), "md5": file_md5(a)}}
+    # The last line was cut short by the interruption
+    partial.write_text(json.dumps(record) + "\n" + '{"entry": {"path": "b.m')
+
+    llms = []
+
+    def make_llm(*args, **kwargs):
+        llms.append(StubLLM(*args, **kwargs))
+        return llms[-1]
+
+    monkeypatch.setattr(generate_catalog, "LLMClient", make_llm)
+    monkeypatch.setattr(generate_catalog, "HASH_CACHE_FILE", tmp_path / "cache.json")
+    monkeypatch.setattr(sys, "argv", [
+        "generate_catalog.py", "--docs-dir", str(docs_dir), "--output", str(output),
+        "--branch-map", str(tmp_path / "missing.tsv"), "--api-key", "test",
+    ])
+    asyncio.run(generate_catalog.main())
+
+    assert llms[0].single_calls == [b_rel]
+    catalog = [json.loads(line) for line in output.read_text().splitlines()]
+    assert catalog == [recovered, {"path": b_rel, "description": f"single: {b_rel}"}]
+    assert not partial.exists()
+
+
+def test_rate_limiter_refund_settles_both_ways():
+    """Test over-estimates are returned and overages are deducted."""
+    limiter = RateLimiter(tpm=1000)
+    asyncio.run(limiter.acquire(100))
+    limiter.refund(50)
+    assert 950 <= limiter._tokens < 951
+    limiter.refund(-2000)
+    assert limiter._tokens < -1000
+
+
+def test_rate_limiter_waiter_does_not_block_admissible_requests():
+    """Test a request waiting for tokens doesn't hold up one that fits."""
+    async def scenario():
+        limiter = RateLimiter(rpm=600, tpm=60)
+        await limiter.acquire(60)  # drains the token bucket
+        starved = asyncio.create_task(limiter.acquire(60))
+        await asyncio.sleep(0)
+        try:
+            # Needs only a request slot, which the RPM bucket still has
+            await asyncio.wait_for(limiter.acquire(0), timeout=1)
+        finally:
+            starved.cancel()
+        return starved
+
+    starved = asyncio.run(scenario())
+    assert starved.cancelled()